@@ -1,224 +1,270 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
-def generate_credit_card_origination_data(num_records=1000, start_date='2023-01-01', end_date='2023-12-31'):
+def generate_credit_card_origination_data(num_records=1000, start_date='2023-01-01', end_date='2023-12-31',
+                                          num_workers=None):
     """
     Generate synthetic credit card origination data with realistic patterns.
     
+    Every column is drawn for all records at once with NumPy array operations,
+    so generation time scales with the array size rather than a Python loop.
+    
     Args:
         num_records: Number of credit card applications to generate
         start_date: Start date for applications
         end_date: End date for applications
+        num_workers: Number of worker processes; rows are split into one chunk
+            per worker, each with its own independent random stream. None or 1
+            generates everything in the current process.
     
     Returns:
         pandas DataFrame with credit card origination data
     """
-    np.random.seed(42)
-    random.seed(42)
-    
     # Date range
     start = datetime.strptime(start_date, '%Y-%m-%d')
     end = datetime.strptime(end_date, '%Y-%m-%d')
     date_range = (end - start).days
     
-    # Generate data
-    data = []
+    num_chunks = min(num_workers or 1, num_records)
+    if num_chunks <= 1:
+        return _generate_chunk(0, num_records, 42, start, date_range)
+    
+    # One row range and one spawned seed per chunk keeps streams reproducible and independent
+    counts = [len(c) for c in np.array_split(np.arange(num_records), num_chunks)]
+    first_ids = np.cumsum([0] + counts[:-1]).tolist()
+    seeds = np.random.SeedSequence(42).spawn(num_chunks)
+    
+    with ProcessPoolExecutor(max_workers=num_chunks) as executor:
+        chunks = list(executor.map(_generate_chunk, first_ids, counts, seeds,
+                                   [start] * num_chunks, [date_range] * num_chunks))
+    
+    return pd.concat(chunks, ignore_index=True)
+
+def _generate_chunk(first_id, num_records, seed, start, date_range):
+    """Generate `num_records` applications numbered from `first_id` using its own RNG."""
+    rng = np.random.default_rng(seed)
+    n = num_records
     
     # Credit card products
-    products = ['Platinum', 'Gold', 'Classic', 'Secured', 'Student', 'Business']
-    product_weights = [0.15, 0.25, 0.20, 0.10, 0.15, 0.15]
+    products = np.array(['Platinum', 'Gold', 'Classic', 'Secured', 'Student', 'Business'])
+    
+    # Product weights by credit score tier (<580, <670, <740, 740+)
+    product_weights_by_tier = np.array([
+        [0.05, 0.10, 0.15, 0.40, 0.20, 0.10],
+        [0.10, 0.20, 0.30, 0.15, 0.15, 0.10],
+        [0.15, 0.30, 0.25, 0.05, 0.10, 0.15],
+        [0.25, 0.35, 0.15, 0.05, 0.05, 0.15]
+    ])
+    credit_score_tier_edges = [580, 670, 740]
+    
+    # Requested limit range per product (same order as products)
+    requested_limit_ranges = np.array([
+        (10000, 50000),    # Platinum
+        (5000, 25000),     # Gold
+        (2000, 15000),     # Classic
+        (500, 5000),       # Secured
+        (1000, 8000),      # Student
+        (15000, 100000)    # Business
+    ])
+    
+    # Approval probability adjustment per product (same order as products)
+    product_approval_adjustments = np.array([0.0, 0.0, 0.0, 0.30, -0.10, 0.0])
     
     # Credit score ranges with realistic distribution
-    credit_score_ranges = [
+    credit_score_ranges = np.array([
         (300, 579, 0.15),   # Poor
         (580, 669, 0.25),   # Fair
         (670, 739, 0.35),   # Good
         (740, 799, 0.20),   # Very Good
         (800, 850, 0.05)    # Excellent
-    ]
+    ])
     
     # Income brackets
-    income_brackets = [
+    income_brackets = np.array([
         (20000, 40000, 0.25),
         (40000, 75000, 0.35),
         (75000, 125000, 0.25),
         (125000, 200000, 0.10),
         (200000, 500000, 0.05)
-    ]
+    ])
     
     # States with different approval rates
-    states = ['CA', 'TX', 'FL', 'NY', 'IL', 'PA', 'OH', 'GA', 'NC', 'MI']
-    state_approval_factors = {
-        'CA': 1.1, 'TX': 1.05, 'FL': 0.95, 'NY': 0.98, 'IL': 1.02,
-        'PA': 1.0, 'OH': 0.97, 'GA': 0.96, 'NC': 1.03, 'MI': 0.99
-    }
+    states = np.array(['CA', 'TX', 'FL', 'NY', 'IL', 'PA', 'OH', 'GA', 'NC', 'MI'])
+    state_approval_factors = np.array([1.1, 1.05, 0.95, 0.98, 1.02, 1.0, 0.97, 0.96, 1.03, 0.99])
+    
+    # Application channels
+    channels = np.array(['Online', 'Branch', 'Phone', 'Mobile App', 'Mail'])
+    channel_weights = [0.35, 0.25, 0.15, 0.20, 0.05]
+    
+    # Application date (weighted towards recent months)
+    days_offset = np.minimum(rng.exponential(date_range / 3, n).astype(int), date_range)
+    application_dates = pd.Timestamp(start) + pd.to_timedelta(days_offset, unit='D')
+    
+    # Customer demographics
+    age = np.clip(rng.normal(38, 12, n).astype(int), 18, 80)
+    
+    # Credit score: pick a range by its weight, then a score within it
+    bucket = _sample_buckets(rng, credit_score_ranges[:, 2], n)
+    credit_score = rng.integers(credit_score_ranges[bucket, 0].astype(int),
+                                credit_score_ranges[bucket, 1].astype(int), endpoint=True)
+    
+    # Annual income
+    bracket = _sample_buckets(rng, income_brackets[:, 2], n)
+    annual_income = rng.uniform(income_brackets[bracket, 0], income_brackets[bracket, 1])
+    
+    # State
+    state_idx = rng.integers(0, len(states), n)
+    
+    # Product choice (influenced by credit score)
+    tier = np.searchsorted(credit_score_tier_edges, credit_score, side='right')
+    tier_cdf = np.cumsum(product_weights_by_tier, axis=1)
+    tier_cdf[:, -1] = 1.0
+    product_idx = (rng.random(n)[:, None] < tier_cdf[tier]).argmax(axis=1)
     
-    for i in range(num_records):
-        # Application date (weighted towards recent months)
-        days_offset = int(np.random.exponential(date_range/3))
-        days_offset = min(days_offset, date_range)
-        application_date = start + timedelta(days=days_offset)
-        
-        # Customer demographics
-        age = np.random.normal(38, 12)
-        age = max(18, min(80, int(age)))
-        
-        # Credit score
-        credit_score = 0
-        rand = np.random.random()
-        cumulative = 0
-        for min_score, max_score, weight in credit_score_ranges:
-            cumulative += weight
-            if rand <= cumulative:
-                credit_score = np.random.randint(min_score, max_score + 1)
-                break
-        
-        # Annual income
-        rand = np.random.random()
-        cumulative = 0
-        min_income, max_income = 30000, 60000
-        for min_inc, max_inc, weight in income_brackets:
-            cumulative += weight
-            if rand <= cumulative:
-                min_income, max_income = min_inc, max_inc
-                break
-        annual_income = np.random.uniform(min_income, max_income)
-        
-        # State
-        state = np.random.choice(states)
-        
-        # Product choice (influenced by credit score)
-        if credit_score < 580:
-            product_weights_adj = [0.05, 0.10, 0.15, 0.40, 0.20, 0.10]
-        elif credit_score < 670:
-            product_weights_adj = [0.10, 0.20, 0.30, 0.15, 0.15, 0.10]
-        elif credit_score < 740:
-            product_weights_adj = [0.15, 0.30, 0.25, 0.05, 0.10, 0.15]
-        else:
-            product_weights_adj = [0.25, 0.35, 0.15, 0.05, 0.05, 0.15]
-        
-        product = np.random.choice(products, p=product_weights_adj)
-        
-        # Credit limit requested
-        if product == 'Secured':
-            requested_limit = np.random.uniform(500, 5000)
-        elif product == 'Student':
-            requested_limit = np.random.uniform(1000, 8000)
-        elif product == 'Classic':
-            requested_limit = np.random.uniform(2000, 15000)
-        elif product == 'Gold':
-            requested_limit = np.random.uniform(5000, 25000)
-        elif product == 'Platinum':
-            requested_limit = np.random.uniform(10000, 50000)
-        else:  # Business
-            requested_limit = np.random.uniform(15000, 100000)
-        
-        # Approval decision (based on multiple factors)
-        approval_probability = 0.5
-        
-        # Credit score impact
-        if credit_score >= 740:
-            approval_probability += 0.35
-        elif credit_score >= 670:
-            approval_probability += 0.25
-        elif credit_score >= 580:
-            approval_probability += 0.10
-        else:
-            approval_probability -= 0.20
-        
-        # Income impact
-        if annual_income >= 100000:
-            approval_probability += 0.15
-        elif annual_income >= 50000:
-            approval_probability += 0.10
-        
-        # Age impact
-        if age >= 25 and age <= 65:
-            approval_probability += 0.05
-        
-        # State factor
-        approval_probability *= state_approval_factors[state]
-        
-        # Product type impact
-        if product == 'Secured':
-            approval_probability += 0.30
-        elif product == 'Student':
-            approval_probability -= 0.10
-        
-        approval_probability = max(0.1, min(0.95, approval_probability))
-        approved = np.random.random() < approval_probability
-        
-        # Approved credit limit (if approved)
-        if approved:
-            if credit_score >= 740:
-                approved_limit = requested_limit * np.random.uniform(0.9, 1.1)
-            elif credit_score >= 670:
-                approved_limit = requested_limit * np.random.uniform(0.7, 0.95)
-            else:
-                approved_limit = requested_limit * np.random.uniform(0.3, 0.7)
-            
-            approved_limit = min(approved_limit, 100000)  # Cap at 100k
-        else:
-            approved_limit = 0
-        
-        # Application channel
-        channels = ['Online', 'Branch', 'Phone', 'Mobile App', 'Mail']
-        channel_weights = [0.35, 0.25, 0.15, 0.20, 0.05]
-        application_channel = np.random.choice(channels, p=channel_weights)
-        
-        # Processing time (days)
-        if approved:
-            processing_time = np.random.exponential(3) + 1
-        else:
-            processing_time = np.random.exponential(2) + 0.5
-        processing_time = min(processing_time, 30)  # Cap at 30 days
-        
-        data.append({
-            'Application_ID': f'CC{2023}{i:06d}',
-            'Application_Date': application_date.strftime('%Y-%m-%d'),
-            'Customer_Age': age,
-            'Credit_Score': credit_score,
-            'Annual_Income': annual_income,
-            'State': state,
-            'Product_Type': product,
-            'Requested_Limit': requested_limit,
-            'Approved_Limit': approved_limit,
-            'Approved': approved,
-            'Application_Channel': application_channel,
-            'Processing_Time_Days': processing_time,
-            'Month': application_date.strftime('%Y-%m'),
-            'Quarter': f"Q{((application_date.month-1)//3)+1}"
-        })
-    
-    return pd.DataFrame(data)
+    # Credit limit requested
+    requested_limit = rng.uniform(requested_limit_ranges[product_idx, 0],
+                                  requested_limit_ranges[product_idx, 1])
+    
+    # Approval decision (based on multiple factors)
+    approval_probability = 0.5 + np.select(
+        [credit_score >= 740, credit_score >= 670, credit_score >= 580],
+        [0.35, 0.25, 0.10], default=-0.20)
+    approval_probability += np.select(
+        [annual_income >= 100000, annual_income >= 50000], [0.15, 0.10], default=0.0)
+    approval_probability += np.where((age >= 25) & (age <= 65), 0.05, 0.0)
+    approval_probability *= state_approval_factors[state_idx]
+    approval_probability += product_approval_adjustments[product_idx]
+    approval_probability = np.clip(approval_probability, 0.1, 0.95)
+    approved = rng.random(n) < approval_probability
+    
+    # Approved credit limit (0 if declined, capped at 100k)
+    strong_credit = [credit_score >= 740, credit_score >= 670]
+    limit_factor = rng.uniform(np.select(strong_credit, [0.9, 0.7], default=0.3),
+                               np.select(strong_credit, [1.1, 0.95], default=0.7))
+    approved_limit = np.where(approved, np.minimum(requested_limit * limit_factor, 100000), 0.0)
+    
+    # Application channel
+    channel_idx = rng.choice(len(channels), n, p=channel_weights)
+    
+    # Processing time (days), capped at 30 days
+    processing_time = np.minimum(
+        rng.exponential(np.where(approved, 3.0, 2.0)) + np.where(approved, 1.0, 0.5), 30)
+    
+    # Narrow dtypes: small ints, float32 income, categoricals for low-cardinality labels.
+    # Labels stay as integer codes into fixed categories, so no per-row strings are built
+    # and chunks concatenate without falling back to object.
+    return pd.DataFrame({
+        'Application_ID': _format_application_ids(first_id, n),
+        'Application_Date': application_dates,
+        'Customer_Age': age.astype(np.int8),
+        'Credit_Score': credit_score.astype(np.int16),
+        'Annual_Income': annual_income.astype(np.float32),
+        'State': pd.Categorical.from_codes(state_idx, states),
+        'Product_Type': pd.Categorical.from_codes(product_idx, products),
+        'Requested_Limit': requested_limit,
+        'Approved_Limit': approved_limit,
+        'Approved': approved,
+        'Application_Channel': pd.Categorical.from_codes(channel_idx, channels),
+        'Processing_Time_Days': processing_time,
+        'Month': np.datetime_as_string(application_dates.values.astype('datetime64[M]')),
+        'Quarter': pd.Categorical('Q' + application_dates.quarter.astype(str),
+                                  categories=['Q1', 'Q2', 'Q3', 'Q4'])
+    })
+
+def _sample_buckets(rng, weights, size):
+    """Draw `size` bucket indices according to `weights` via a CDF search."""
+    cdf = np.cumsum(weights)
+    return np.minimum(np.searchsorted(cdf, rng.random(size)), len(weights) - 1)
+
+def _format_application_ids(first_id, num_records, prefix='CC2023', num_digits=6):
+    """
+    Build IDs like 'CC2023000042' for a run of consecutive numbers in one array pass.
+    
+    Digits are computed arithmetically into a byte matrix and viewed as fixed-width
+    strings, so no per-row formatting happens in Python. Runs that outgrow
+    `num_digits` fall back to per-row formatting, which widens only those IDs.
+    """
+    if first_id + num_records > 10 ** num_digits:
+        return [f'{prefix}{i:0{num_digits}d}' for i in range(first_id, first_id + num_records)]
+    
+    ids = np.arange(first_id, first_id + num_records)
+    width = len(prefix) + num_digits
+    chars = np.empty((num_records, width), dtype=np.uint8)
+    chars[:, :len(prefix)] = np.frombuffer(prefix.encode('ascii'), dtype=np.uint8)
+    chars[:, len(prefix):] = ids[:, None] // 10 ** np.arange(num_digits - 1, -1, -1) % 10 + ord('0')
+    return chars.view(f'S{width}').ravel().astype(f'U{width}')
 
 def create_credit_card_summary_stats(df):
     """Create summary statistics for the credit card data."""
+    # One grouping pass for both product aggregates, most applications first
+    by_product = (df.groupby('Product_Type', observed=True)['Approved']
+                    .agg(['size', 'mean'])
+                    .sort_values('size', ascending=False))
     summary = {
         'total_applications': len(df),
         'approval_rate': df['Approved'].mean(),
         'avg_credit_score': df['Credit_Score'].mean(),
         'avg_income': df['Annual_Income'].mean(),
-        'avg_approved_limit': df[df['Approved']]['Approved_Limit'].mean() if df['Approved'].any() else 0,
-        'applications_by_product': df['Product_Type'].value_counts().to_dict(),
-        'approval_by_product': df.groupby('Product_Type')['Approved'].mean().to_dict(),
-        'applications_by_state': df['State'].value_counts().to_dict(),
-        'applications_by_channel': df['Application_Channel'].value_counts().to_dict(),
+        'avg_approved_limit': df.loc[df['Approved'], 'Approved_Limit'].mean() if df['Approved'].any() else 0,
+        'applications_by_product': by_product['size'].to_dict(),
+        'approval_by_product': by_product['mean'].to_dict(),
+        # Categorical columns also count unused categories; keep only values that occur
+        'applications_by_state': df['State'].value_counts()[lambda counts: counts > 0].to_dict(),
+        'applications_by_channel': df['Application_Channel'].value_counts()[lambda counts: counts > 0].to_dict(),
         'monthly_trends': df.groupby('Month').size().to_dict()
     }
     return summary
 
+# Rows per block that write_xlsx_streaming converts to blank-aware Python values at once
+XLSX_BLOCK_ROWS = 10000
+
+def write_xlsx_streaming(df, path, sheet_name='Sheet1'):
+    """
+    Write `df` to `path` with xlsxwriter in constant-memory mode.
+    
+    Rows are flushed to disk as they are written instead of being held as a
+    workbook of cell objects. Constant-memory mode only accepts rows in order,
+    so the sheet is written row by row rather than through `DataFrame.to_excel`,
+    which fills it column by column. Missing values (NaN, NaT, NA) become blank
+    cells, as with `to_excel`; rows are cleaned a block at a time so memory stays
+    bounded.
+    """
+    options = {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd'}
+    with pd.ExcelWriter(path, engine='xlsxwriter', engine_kwargs={'options': options}) as writer:
+        worksheet = writer.book.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, df.columns)
+        row_num = 1
+        for start in range(0, len(df), XLSX_BLOCK_ROWS):
+            block = df.iloc[start:start + XLSX_BLOCK_ROWS].astype(object)
+            block = block.where(block.notna(), None)
+            for row in block.itertuples(index=False, name=None):
+                worksheet.write_row(row_num, 0, row)
+                row_num += 1
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic credit card origination data.")
+    parser.add_argument('--format', choices=['parquet', 'feather', 'xlsx'], default='parquet',
+                        help="Output file format (default: parquet; xlsx is much slower to write)")
+    args = parser.parse_args()
+    
     # Generate the dataset
     print("Generating credit card origination dataset...")
     df = generate_credit_card_origination_data(num_records=1000)
     
-    # Save to Excel
-    df.to_excel("credit_card_originations.xlsx", index=False)
+    # Save in a columnar format unless Excel output is explicitly requested
+    output_file = f"credit_card_originations.{args.format}"
+    if args.format == 'parquet':
+        df.to_parquet(output_file, compression='zstd', index=False)
+    elif args.format == 'feather':
+        df.to_feather(output_file)
+    else:
+        print("Warning: .xlsx is written cell by cell and is the slow path; prefer parquet or feather")
+        write_xlsx_streaming(df, output_file)
     print(f"Generated {len(df)} credit card applications")
-    print("Data saved to: credit_card_originations.xlsx")
+    print(f"Data saved to: {output_file}")
     
     # Display summary statistics
     summary = create_credit_card_summary_stats(df)
@@ -13,213 +13,161 @@ class ChartType(Enum):
     STACKED_BAR = "stacked_bar"
     STACKED_AREA = "stacked_area"
 
+# Chart suitability rules: a chart's score is the sum of the weights of the
+# predicates that hold for the data, capped at 1.0. Ties go to the chart listed first.
+CHART_RULES = {
+    ChartType.BAR: {
+        'cat_and_num': 0.8,                    # Categorical vs numerical
+        'target_num_with_other_cat': 0.6,      # Comparing values across categories
+        'max_cat_up_to_10': 0.4,               # Not too many categories
+        'max_cat_11_to_20': 0.2,
+    },
+    ChartType.LINE: {
+        'has_datetime': 0.9,                   # Time series data
+        'has_num': 0.5,                        # Trends over ordered categories
+        'target_num': 0.3,                     # Continuous data
+    },
+    ChartType.PIE: {
+        'one_num_one_cat': 0.7,                # Single numerical column with categories
+        'cat_2_to_7': 0.6,                     # Limited number of categories (2-7 ideal)
+        'cat_up_to_10_not_2_to_7': 0.3,
+        'target_non_negative': 0.2,            # Parts of a whole
+    },
+    ChartType.SCATTER: {
+        'two_num': 1.2,                        # Relationships between numeric variables
+        'rows_over_50': 0.2,                   # Large datasets
+    },
+    ChartType.AREA: {
+        'has_datetime': 0.7,                   # Like line, but shows magnitude
+        'has_num': 0.5,                        # Cumulative data
+    },
+    ChartType.HISTOGRAM: {
+        'one_num': 0.8,                        # Single numeric column distribution
+        'target_num': 0.6,                     # Frequency distribution
+        'rows_at_least_20': 0.3,               # Sufficient data points
+    },
+    ChartType.STACKED_BAR: {
+        'cat_and_two_num': 0.8,                # Composition across categories
+        'target_num': 0.6,                     # Part-to-whole relationships
+        'other_cat_up_to_8': 0.4,              # Comparing totals across categories
+    },
+    ChartType.STACKED_AREA: {
+        'datetime_and_two_num': 0.9,           # Time series with composition
+        'two_num': 0.7,                        # Cumulative totals
+        'has_datetime': 0.5,                   # Trend analysis with composition
+    },
+}
+
+RULE_PREDICATES = tuple(dict.fromkeys(name for rules in CHART_RULES.values() for name in rules))
+
 class DataAnalyzer:
     def __init__(self):
-        self.chart_rules = {
-            ChartType.BAR: self._should_use_bar,
-            ChartType.LINE: self._should_use_line,
-            ChartType.PIE: self._should_use_pie,
-            ChartType.SCATTER: self._should_use_scatter,
-            ChartType.AREA: self._should_use_area,
-            ChartType.HISTOGRAM: self._should_use_histogram,
-            ChartType.STACKED_BAR: self._should_use_stacked_bar,
-            ChartType.STACKED_AREA: self._should_use_stacked_area
-        }
+        self.chart_types = list(CHART_RULES)
+        self.rule_weights = np.array([[rules.get(name, 0.0) for name in RULE_PREDICATES]
+                                      for rules in CHART_RULES.values()])
     
-    def analyze_data(self, data: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze data structure and return insights for chart selection."""
-        analysis = {
+    def analyze_data(self, data: pd.DataFrame, include_stats: bool = False,
+                     include_unique_counts: bool = True) -> Dict[str, Any]:
+        """Analyze data structure and return insights for chart selection.
+        
+        Descriptive statistics and the correlation matrix are only computed when
+        `include_stats` is True; chart selection never needs them. Per-column unique
+        counts, the costliest part, can be left out with `include_unique_counts=False`
+        when no chart will be recommended from the result.
+        """
+        analysis = self._analyze_structure(data, include_unique_counts)
+        if include_stats:
+            analysis.update(self.analyze_stats(data, analysis['numeric_columns']))
+        return analysis
+    
+    def _analyze_structure(self, data: pd.DataFrame, include_unique_counts: bool = True) -> Dict[str, Any]:
+        """Column types, null counts and cardinality used by the chart rules."""
+        structure = {
             'shape': data.shape,
             'dtypes': data.dtypes.to_dict(),
             'numeric_columns': data.select_dtypes(include=[np.number]).columns.tolist(),
             'categorical_columns': data.select_dtypes(include=['object', 'category']).columns.tolist(),
             'datetime_columns': data.select_dtypes(include=['datetime64']).columns.tolist(),
             'missing_values': data.isnull().sum().to_dict(),
-            'unique_counts': {col: data[col].nunique() for col in data.columns}
         }
-        
-        # Additional analysis
-        analysis['numeric_stats'] = data[analysis['numeric_columns']].describe().to_dict() if analysis['numeric_columns'] else {}
-        analysis['correlation_matrix'] = data[analysis['numeric_columns']].corr().to_dict() if len(analysis['numeric_columns']) > 1 else {}
-        
-        return analysis
-    
-    def recommend_chart_type(self, data: pd.DataFrame, target_column: str = None) -> Tuple[ChartType, float]:
-        """Recommend the best chart type based on data structure."""
-        analysis = self.analyze_data(data)
-        
-        scores = {}
-        for chart_type, rule_func in self.chart_rules.items():
-            score = rule_func(data, analysis, target_column)
-            scores[chart_type] = score
-        
-        best_chart = max(scores, key=scores.get)
-        confidence = scores[best_chart]
-        
-        return best_chart, confidence
-    
-    def _should_use_bar(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for bar chart suitability."""
-        score = 0.0
-        
-        # Good for categorical vs numerical
-        if (len(analysis['categorical_columns']) >= 1 and 
-            len(analysis['numeric_columns']) >= 1):
-            score += 0.8
-        
-        # Good for comparing values across categories
-        if target_column and target_column in analysis['numeric_columns']:
-            cat_cols = [col for col in analysis['categorical_columns'] if col != target_column]
-            if cat_cols:
-                score += 0.6
-        
-        # Not too many categories
-        if analysis['categorical_columns']:
-            max_unique = max(analysis['unique_counts'][col] for col in analysis['categorical_columns'])
-            if max_unique <= 10:
-                score += 0.4
-            elif max_unique <= 20:
-                score += 0.2
-        
-        return min(score, 1.0)
-    
-    def _should_use_line(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for line chart suitability."""
-        score = 0.0
-        
-        # Good for time series data
-        if analysis['datetime_columns']:
-            score += 0.9
-        
-        # Good for showing trends over ordered categories
-        if len(analysis['numeric_columns']) >= 1:
-            score += 0.5
-        
-        # Good for continuous data
-        if target_column and target_column in analysis['numeric_columns']:
-            score += 0.3
-        
-        return min(score, 1.0)
-    
-    def _should_use_pie(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for pie chart suitability."""
-        score = 0.0
-        
-        # Only for single numerical column with categories
-        if (len(analysis['numeric_columns']) == 1 and 
-            len(analysis['categorical_columns']) == 1):
-            score += 0.7
-        
-        # Limited number of categories (2-7 ideal)
-        if analysis['categorical_columns']:
-            unique_counts = [analysis['unique_counts'][col] for col in analysis['categorical_columns']]
-            if any(2 <= count <= 7 for count in unique_counts):
-                score += 0.6
-            elif any(count <= 10 for count in unique_counts):
-                score += 0.3
-        
-        # Data should represent parts of a whole
-        if target_column and target_column in analysis['numeric_columns']:
-            col_data = data[target_column].dropna()
-            if (col_data >= 0).all():  # All non-negative values
-                score += 0.2
-        
-        return min(score, 1.0)
-    
-    def _should_use_scatter(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for scatter plot suitability."""
-        score = 0.0
-        
-        # Need at least 2 numeric columns
-        if len(analysis['numeric_columns']) >= 2:
-            score += 0.8
-        
-        # Good for showing relationships between variables
-        if len(analysis['numeric_columns']) >= 2:
-            score += 0.4
-        
-        # Good for large datasets
-        if data.shape[0] > 50:
-            score += 0.2
-        
-        return min(score, 1.0)
+        if include_unique_counts:
+            structure['unique_counts'] = data.nunique().to_dict()
+        return structure
     
-    def _should_use_stacked_bar(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for stacked bar chart suitability."""
-        score = 0.0
-        
-        # Good for multiple categories showing composition
-        if (len(analysis['categorical_columns']) >= 1 and 
-            len(analysis['numeric_columns']) >= 2):
-            score += 0.8
-        
-        # Good for showing part-to-whole relationships
-        if target_column and target_column in analysis['numeric_columns']:
-            score += 0.6
-        
-        # Good for comparing totals across categories
-        if analysis['categorical_columns']:
-            cat_cols = [col for col in analysis['categorical_columns'] if col != target_column]
-            if cat_cols:
-                max_unique = max(analysis['unique_counts'][col] for col in cat_cols)
-                if max_unique <= 8:
-                    score += 0.4
-        
-        return min(score, 1.0)
+    def analyze_stats(self, data: pd.DataFrame, numeric_columns: List[str] = None) -> Dict[str, Any]:
+        """Descriptive statistics and correlation matrix for the numeric columns."""
+        if numeric_columns is None:
+            numeric_columns = data.select_dtypes(include=[np.number]).columns.tolist()
+        return {
+            'numeric_stats': data[numeric_columns].describe().to_dict() if numeric_columns else {},
+            'correlation_matrix': data[numeric_columns].corr().to_dict() if len(numeric_columns) > 1 else {}
+        }
     
-    def _should_use_stacked_area(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for stacked area chart suitability."""
-        score = 0.0
-        
-        # Good for time series with composition
-        if analysis['datetime_columns'] and len(analysis['numeric_columns']) >= 2:
-            score += 0.9
-        
-        # Good for showing cumulative totals
-        if len(analysis['numeric_columns']) >= 2:
-            score += 0.7
+    def recommend_chart_type(self, data: pd.DataFrame, target_column: str = None,
+                             analysis: Dict[str, Any] = None) -> Tuple[ChartType, float]:
+        """Recommend the best chart type based on data structure, reusing `analysis` if given."""
+        if analysis is None:
+            analysis = self._analyze_structure(data)
         
-        # Good for trend analysis with composition
-        if analysis['datetime_columns']:
-            score += 0.5
+        predicates = self._evaluate_predicates(self._extract_features(data, analysis, target_column))
+        scores = np.minimum(self.rule_weights @ predicates, 1.0)
+        best = int(np.argmax(scores))
         
-        return min(score, 1.0)
+        return self.chart_types[best], float(scores[best])
     
-    def _should_use_area(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for area chart suitability."""
-        score = 0.0
-        
-        # Similar to line but good for showing magnitude
-        if analysis['datetime_columns']:
-            score += 0.7
-        
-        # Good for cumulative data
-        if len(analysis['numeric_columns']) >= 1:
-            score += 0.5
-        
-        return min(score, 1.0)
+    def _extract_features(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> Dict[str, Any]:
+        """Reduce the analysis to the handful of values the chart rules compare against."""
+        categorical_columns = analysis['categorical_columns']
+        unique_counts = analysis['unique_counts']
+        cat_unique = [unique_counts[col] for col in categorical_columns]
+        other_cat_unique = [unique_counts[col] for col in categorical_columns if col != target_column]
+        target_is_numeric = bool(target_column) and target_column in analysis['numeric_columns']
+        
+        return {
+            'n_num': len(analysis['numeric_columns']),
+            'n_cat': len(categorical_columns),
+            'n_dt': len(analysis['datetime_columns']),
+            'n_rows': data.shape[0],
+            'max_cat_unique': max(cat_unique, default=None),
+            'max_other_cat_unique': max(other_cat_unique, default=None),
+            'has_cat_2_to_7': any(2 <= count <= 7 for count in cat_unique),
+            'has_cat_up_to_10': any(count <= 10 for count in cat_unique),
+            'target_is_numeric': target_is_numeric,
+            'target_non_negative': target_is_numeric and bool((data[target_column].dropna() >= 0).all())
+        }
     
-    def _should_use_histogram(self, data: pd.DataFrame, analysis: Dict, target_column: str = None) -> float:
-        """Score for histogram suitability."""
-        score = 0.0
-        
-        # Good for single numeric column distribution
-        if len(analysis['numeric_columns']) == 1:
-            score += 0.8
-        
-        # Good for showing frequency distribution
-        if target_column and target_column in analysis['numeric_columns']:
-            score += 0.6
-        
-        # Need sufficient data points
-        if data.shape[0] >= 20:
-            score += 0.3
-        
-        return min(score, 1.0)
+    def _evaluate_predicates(self, features: Dict[str, Any]) -> np.ndarray:
+        """Evaluate every rule predicate, in RULE_PREDICATES order, as a 0/1 vector."""
+        n_num, n_cat, n_dt = features['n_num'], features['n_cat'], features['n_dt']
+        max_cat = features['max_cat_unique']
+        max_other_cat = features['max_other_cat_unique']
+        values = {
+            'cat_and_num': n_cat >= 1 and n_num >= 1,
+            'target_num_with_other_cat': features['target_is_numeric'] and max_other_cat is not None,
+            'max_cat_up_to_10': max_cat is not None and max_cat <= 10,
+            'max_cat_11_to_20': max_cat is not None and 10 < max_cat <= 20,
+            'has_datetime': n_dt >= 1,
+            'has_num': n_num >= 1,
+            'target_num': features['target_is_numeric'],
+            'one_num_one_cat': n_num == 1 and n_cat == 1,
+            'cat_2_to_7': features['has_cat_2_to_7'],
+            'cat_up_to_10_not_2_to_7': features['has_cat_up_to_10'] and not features['has_cat_2_to_7'],
+            'target_non_negative': features['target_non_negative'],
+            'two_num': n_num >= 2,
+            'rows_over_50': features['n_rows'] > 50,
+            'one_num': n_num == 1,
+            'rows_at_least_20': features['n_rows'] >= 20,
+            'cat_and_two_num': n_cat >= 1 and n_num >= 2,
+            'other_cat_up_to_8': max_other_cat is not None and max_other_cat <= 8,
+            'datetime_and_two_num': n_dt >= 1 and n_num >= 2,
+        }
+        return np.array([values[name] for name in RULE_PREDICATES], dtype=float)
     
-    def get_chart_config(self, data: pd.DataFrame, chart_type: ChartType, target_column: str = None) -> Dict[str, Any]:
-        """Generate configuration for the selected chart type."""
-        analysis = self.analyze_data(data)
+    def get_chart_config(self, data: pd.DataFrame, chart_type: ChartType, target_column: str = None,
+                         analysis: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Generate configuration for the selected chart type, reusing `analysis` if given."""
+        if analysis is None:
+            analysis = self._analyze_structure(data)
         config = {'chart_type': chart_type.value}
         
         if chart_type == ChartType.BAR:
@@ -12,24 +12,27 @@ from ppt_skill_generator import PowerPointSkillGenerator
 def create_sample_data():
     """Create sample datasets for demonstration."""
     
+    # Local generator so the global NumPy random state is left untouched
+    rng = np.random.default_rng(42)
+    
     # Sales data (good for bar charts)
-    np.random.seed(42)
     sales_data = pd.DataFrame({
         'Region': ['North', 'South', 'East', 'West', 'Central'] * 4,
         'Product': ['A', 'B', 'C', 'D'] * 5,
-        'Sales': np.random.randint(1000, 10000, 20),
+        'Sales': rng.integers(1000, 10000, 20),
         'Quarter': ['Q1', 'Q2', 'Q3', 'Q4'] * 5
     })
     
     # Time series data (good for line charts)
     dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='M')
+    revenue = np.cumsum(rng.integers(5000, 15000, len(dates)))
+    expenses = np.cumsum(rng.integers(3000, 8000, len(dates)))
     time_series_data = pd.DataFrame({
         'Date': dates,
-        'Revenue': np.cumsum(np.random.randint(5000, 15000, len(dates))),
-        'Expenses': np.cumsum(np.random.randint(3000, 8000, len(dates))),
-        'Profit': None
+        'Revenue': revenue,
+        'Expenses': expenses,
+        'Profit': revenue - expenses
     })
-    time_series_data['Profit'] = time_series_data['Revenue'] - time_series_data['Expenses']
     
     # Customer demographics (good for pie charts)
     demographics = pd.DataFrame({
@@ -39,9 +42,9 @@ def create_sample_data():
     
     # Performance metrics (good for scatter plots)
     performance = pd.DataFrame({
-        'Experience_Years': np.random.uniform(1, 20, 50),
-        'Performance_Score': 50 + np.random.uniform(0, 50, 50) + np.random.normal(0, 5, 50),
-        'Department': np.random.choice(['Sales', 'Marketing', 'IT', 'HR'], 50)
+        'Experience_Years': rng.uniform(1, 20, 50),
+        'Performance_Score': 50 + rng.uniform(0, 50, 50) + rng.normal(0, 5, 50),
+        'Department': rng.choice(['Sales', 'Marketing', 'IT', 'HR'], 50)
     })
     
     return {
@@ -116,29 +119,17 @@ def example_batch_processing():
     """Example of batch processing multiple files."""
     print("\n=== Batch Processing Example ===")
     
-    # Create sample data files
+    # Create sample datasets
     datasets = create_sample_data()
     
-    # Save datasets to files
-    file_paths = []
-    for name, data in datasets.items():
-        file_path = f"{name}_data.xlsx"
-        data.to_excel(file_path, index=False)
-        file_paths.append(file_path)
-    
-    # Process all files
+    # Process all datasets straight from memory
     generator = PowerPointSkillGenerator()
-    generated_files = generator.batch_process(
-        data_files=file_paths,
+    generated_files = generator.batch_process_dataframes(
+        frames={f"{name}_data": data for name, data in datasets.items()},
         output_dir="batch_output"
     )
     
     print(f"Generated {len(generated_files)} presentations in batch_output/")
-    
-    # Clean up sample files
-    for file_path in file_paths:
-        if os.path.exists(file_path):
-            os.remove(file_path)
 
 def example_from_file():
     """Example loading data from file."""
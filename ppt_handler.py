@@ -1,7 +1,12 @@
 import os
-import matplotlib.pyplot as plt
+import re
+import threading
+from functools import lru_cache
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import matplotlib.patches as mpatches
-import seaborn as sns
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
@@ -10,16 +15,69 @@ from pptx.chart.data import CategoryChartData, ChartData, XyChartData
 from pptx.chart.data import BubbleChartData
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.chart.series import SeriesCollection
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union, BinaryIO
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 import numpy as np
 from io import BytesIO
+from PIL import Image
+from pathlib import Path
 from rbc_branding import RBCBranding
 
+# Size (inches) of the chart picture on a slide; images are rendered at exactly this size
+CHART_WIDTH = 8
+CHART_HEIGHT = 5
+
+# Slide geometry (left, top, width, height) in EMU, converted once
+_TITLE_BOX = (Inches(0.5), Inches(0.2), Inches(9), Inches(1))
+_CHART_BOX = (Inches(1), Inches(1.5), Inches(CHART_WIDTH), Inches(CHART_HEIGHT))
+
+# Slide text styling, resolved once instead of per run
+_TEXT_RGB = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
+_TITLE_FONT = RBCBranding.FONTS['heading']
+_TITLE_PT = Pt(RBCBranding.FONT_SIZES['title'])
+_BODY_FONT = RBCBranding.FONTS['body']
+_BODY_PT = Pt(RBCBranding.FONT_SIZES['body'])
+
+# Bar charts with more bars than this skip per-bar value labels (override with config['label_threshold'])
+BAR_LABEL_THRESHOLD = 25
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\s/\\:*?"<>|]')
+
+def default_output_path(title: str) -> str:
+    """File name for a presentation titled `title`: spaces and path-unsafe characters become '_'."""
+    return f"{_UNSAFE_FILENAME_CHARS.sub('_', title)}.pptx"
+
+@lru_cache(maxsize=64)
+def _color_palette(palette_type: str, n_colors: int) -> Tuple[str, ...]:
+    """RBCBranding.get_color_palette, memoized; a tuple so the shared result can't be mutated."""
+    return tuple(RBCBranding.get_color_palette(palette_type, n_colors))
+
+_STYLE_APPLIED = False
+
+def _apply_style():
+    """Apply the RBC matplotlib style once per process rather than on every handler.
+    
+    Call RBCBranding.setup_matplotlib_style() directly to re-apply it after changing rcParams.
+    """
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        RBCBranding.setup_matplotlib_style()
+        _STYLE_APPLIED = True
+
 class PowerPointHandler:
-    def __init__(self, template_path: str = None):
+    def __init__(self, template_path: str = None, max_workers: int = None):
+        """
+        Args:
+            template_path: Path to PowerPoint template file (optional)
+            max_workers: Processes used to render chart images for multi-chart
+                presentations (by default charts render in-process; a pool is only
+                started for an explicit value above 1)
+        """
         self.template_path = template_path
+        self.max_workers = max_workers
         self.presentation = None
+        self._layouts = []
         self.chart_style_map = {
             'bar': XL_CHART_TYPE.COLUMN_CLUSTERED,
             'line': XL_CHART_TYPE.LINE,
@@ -30,9 +88,11 @@ class PowerPointHandler:
             'stacked_bar': XL_CHART_TYPE.COLUMN_STACKED,
             'stacked_area': XL_CHART_TYPE.AREA
         }
+        self._figure = None
+        self._figure_lock = threading.Lock()
         
         # Set matplotlib style with RBC branding
-        RBCBranding.setup_matplotlib_style()
+        _apply_style()
     
     def load_template(self, template_path: str = None):
         """Load PowerPoint template or create new presentation."""
@@ -43,41 +103,73 @@ class PowerPointHandler:
             self.presentation = Presentation(self.template_path)
         else:
             self.presentation = Presentation()
+        
+        # Resolve the layouts once; each slide_layouts access re-walks the master's XML
+        self._layouts = list(self.presentation.slide_layouts)
     
     def create_chart_image(self, data: pd.DataFrame, chart_config: Dict[str, Any], 
-                          width: int = 10, height: int = 6) -> BytesIO:
-        """Create a chart image using matplotlib and return as BytesIO."""
-        chart_type = chart_config['chart_type']
-        
-        fig, ax = plt.subplots(figsize=(width, height))
-        fig.patch.set_facecolor('white')
-        
-        if chart_type == 'bar':
-            self._create_bar_chart(ax, data, chart_config)
-        elif chart_type == 'line':
-            self._create_line_chart(ax, data, chart_config)
-        elif chart_type == 'pie':
-            self._create_pie_chart(ax, data, chart_config)
-        elif chart_type == 'scatter':
-            self._create_scatter_chart(ax, data, chart_config)
-        elif chart_type == 'area':
-            self._create_area_chart(ax, data, chart_config)
-        elif chart_type == 'histogram':
-            self._create_histogram(ax, data, chart_config)
-        elif chart_type == 'stacked_bar':
-            self._create_stacked_bar_chart(ax, data, chart_config)
-        elif chart_type == 'stacked_area':
-            self._create_stacked_area_chart(ax, data, chart_config)
-        
-        plt.tight_layout()
-        
-        # Save to BytesIO
-        img_buffer = BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
-        
-        return img_buffer
+                          width: float = CHART_WIDTH, height: float = CHART_HEIGHT) -> bytes:
+        """Create a chart image using matplotlib and return the PNG bytes.
+        
+        The figure is laid out once with constrained layout at its final slide size and
+        rasterized at `chart_config['dpi']` (default 150).
+        """
+        with self._figure_lock:
+            chart_type = chart_config['chart_type']
+            
+            # One figure per handler, cleared between charts instead of rebuilt. Clearing the
+            # whole figure (not just the axes) drops legends and pie aspect from the last chart.
+            # The figure is attached straight to an Agg canvas, bypassing pyplot's figure
+            # registry, so rendering works the same whatever backend pyplot is set to.
+            if self._figure is None:
+                self._figure = Figure(layout='constrained')
+                FigureCanvasAgg(self._figure)
+            fig = self._figure
+            dpi = chart_config.get('dpi', 150)
+            fig.clear()
+            fig.set_size_inches(width, height)
+            fig.set_dpi(dpi)
+            fig.patch.set_facecolor('white')
+            ax = fig.add_subplot()
+            
+            if chart_type == 'bar':
+                self._create_bar_chart(ax, data, chart_config)
+            elif chart_type == 'line':
+                self._create_line_chart(ax, data, chart_config)
+            elif chart_type == 'pie':
+                self._create_pie_chart(ax, data, chart_config)
+            elif chart_type == 'scatter':
+                self._create_scatter_chart(ax, data, chart_config)
+            elif chart_type == 'area':
+                self._create_area_chart(ax, data, chart_config)
+            elif chart_type == 'histogram':
+                self._create_histogram(ax, data, chart_config)
+            elif chart_type == 'stacked_bar':
+                self._create_stacked_bar_chart(ax, data, chart_config)
+            elif chart_type == 'stacked_area':
+                self._create_stacked_area_chart(ax, data, chart_config)
+            
+            # Draw once on the Agg canvas and encode its RGBA buffer directly, skipping savefig's
+            # print_figure bookkeeping; light PNG compression since the PPTX is zipped anyway
+            canvas = fig.canvas
+            canvas.draw()
+            img_buffer = BytesIO()
+            Image.frombuffer('RGBA', canvas.get_width_height(physical=True), canvas.buffer_rgba(),
+                             'raw', 'RGBA', 0, 1).save(
+                img_buffer, format='PNG', dpi=(dpi, dpi),
+                compress_level=chart_config.get('compress_level', 1))
+            
+        return img_buffer.getvalue()
+    
+    def close(self):
+        """Release the figure reused for chart images."""
+        self._figure = None
+    
+    @staticmethod
+    def _rotate_xticklabels(ax, rotation: float, **text_props):
+        """Rotate the axis' current x tick labels, right-aligned, like plt.xticks but without pyplot state."""
+        for label in ax.get_xticklabels():
+            label.set(rotation=rotation, horizontalalignment='right', **text_props)
     
     def _create_bar_chart(self, ax, data: pd.DataFrame, config: Dict):
         """Create bar chart with RBC branding."""
@@ -86,11 +178,12 @@ class PowerPointHandler:
         
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('bar')
-        RBCBranding.apply_rbc_theme_to_axis(ax, 'bar')
+        RBCBranding.apply_rbc_theme_to_axis(ax, 'bar', style_config)
         
         # Create bars with RBC colors
-        colors = RBCBranding.get_color_palette('categorical', len(data))
-        bars = ax.bar(data[x_col], data[y_col], color=colors, 
+        x = data[x_col]
+        colors = _color_palette('categorical', len(data))
+        bars = ax.bar(x.to_numpy(), data[y_col].to_numpy(), color=colors, 
                    edgecolor=style_config['edge_color'], linewidth=style_config['edge_width'])
         
         # Set labels and title with RBC fonts
@@ -102,16 +195,27 @@ class PowerPointHandler:
                    fontsize=style_config['title_size'], color=style_config['title_color'], weight='bold')
         
         # Rotate x-axis labels if needed
-        if len(data[x_col].unique()) > 5:
-            plt.xticks(rotation=45, ha='right', fontname=style_config['label_font'], 
-                      fontsize=style_config['label_size'])
-        
-        # Add value labels on bars
-        for i, bar in enumerate(bars):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.1f}', ha='center', va='bottom',
-                   fontname=style_config['label_font'], fontsize=style_config['label_size']-1)
+        if x.nunique(dropna=False) > 5:
+            self._rotate_xticklabels(ax, 45, fontname=style_config['label_font'],
+                                     fontsize=style_config['label_size'])
+        
+        # Add value labels on bars; past the threshold they overlap and dominate render time
+        if len(bars) <= config.get('label_threshold', BAR_LABEL_THRESHOLD):
+            ax.bar_label(bars, fmt='%.1f', padding=0,
+                         fontname=style_config['label_font'], fontsize=style_config['label_size']-1)
+    
+    @staticmethod
+    def _mean_per_x(data: pd.DataFrame, x_col: str, y_col: str) -> Tuple[np.ndarray, np.ndarray]:
+        """x and y arrays for a line/area plot, averaging y over repeated x values.
+        
+        Repeated x values are collapsed to one point each (ordered by x, except plain
+        object columns, which keep first-seen order) so overlapping segments aren't drawn.
+        """
+        x = data[x_col]
+        if x.is_unique:
+            return x.to_numpy(), data[y_col].to_numpy()
+        grouped = data.groupby(x_col, sort=x.dtype != object, observed=True)[y_col].mean()
+        return grouped.index.to_numpy(), grouped.to_numpy()
     
     def _create_line_chart(self, ax, data: pd.DataFrame, config: Dict):
         """Create line chart with RBC branding."""
@@ -120,11 +224,12 @@ class PowerPointHandler:
         
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('line')
-        RBCBranding.apply_rbc_theme_to_axis(ax, 'line')
+        RBCBranding.apply_rbc_theme_to_axis(ax, 'line', style_config)
         
         # Create line with RBC colors
         line_color = RBCBranding.COLORS['primary_blue']
-        ax.plot(data[x_col], data[y_col], marker='o', 
+        x_values, y_values = self._mean_per_x(data, x_col, y_col)
+        ax.plot(x_values, y_values, marker='o', 
                color=line_color, linewidth=style_config['line_width'], 
                markersize=style_config['marker_size'],
                markerfacecolor=RBCBranding.COLORS['accent_yellow'],
@@ -139,9 +244,9 @@ class PowerPointHandler:
                    fontsize=style_config['title_size'], color=style_config['title_color'], weight='bold')
         
         # Format x-axis for dates
-        if data[x_col].dtype == 'datetime64[ns]':
-            fig = ax.figure
-            fig.autofmt_xdate()
+        if is_datetime64_any_dtype(data[x_col].dtype):
+            # Same rotation as fig.autofmt_xdate, minus its subplots_adjust (constrained layout handles spacing)
+            self._rotate_xticklabels(ax, 30)
     
     def _create_pie_chart(self, ax, data: pd.DataFrame, config: Dict):
         """Create pie chart with RBC branding."""
@@ -151,12 +256,21 @@ class PowerPointHandler:
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('pie')
         
-        # Group data by labels and sum values
-        grouped_data = data.groupby(labels_col)[values_col].sum()
+        # Sum values per label with factorize + bincount rather than a groupby: slices keep
+        # first-seen order, missing labels are dropped and missing values count as 0, as
+        # with groupby(sort=False, observed=True).sum()
+        codes, labels = pd.factorize(data[labels_col])
+        values = data[values_col].to_numpy(dtype=float, na_value=np.nan)
+        if len(labels) == len(codes):
+            # Already one row per label (pre-aggregated data): nothing to sum
+            sums = np.nan_to_num(values)
+        else:
+            labelled = codes >= 0
+            sums = np.bincount(codes[labelled], weights=np.nan_to_num(values[labelled]), minlength=len(labels))
         
         # Create pie with RBC colors
-        colors = RBCBranding.get_color_palette('categorical', len(grouped_data))
-        wedges, texts, autotexts = ax.pie(grouped_data.values, labels=grouped_data.index,
+        colors = _color_palette('categorical', len(sums))
+        wedges, texts, autotexts = ax.pie(sums, labels=np.asarray(labels),
                                           autopct='%1.1f%%', startangle=90, colors=colors,
                                           wedgeprops=style_config['wedge_props'])
         
@@ -174,20 +288,28 @@ class PowerPointHandler:
         
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('scatter')
-        RBCBranding.apply_rbc_theme_to_axis(ax, 'scatter')
+        RBCBranding.apply_rbc_theme_to_axis(ax, 'scatter', style_config)
         
         # Create scatter with RBC colors
         scatter_color = RBCBranding.COLORS['primary_blue']
-        ax.scatter(data[x_col], data[y_col], color=scatter_color, 
+        # Float arrays with NaN for missing values, whatever the source dtype (object, nullable)
+        x_values = data[x_col].to_numpy(dtype=float, na_value=np.nan)
+        y_values = data[y_col].to_numpy(dtype=float, na_value=np.nan)
+        ax.scatter(x_values, y_values, color=scatter_color, 
                   alpha=style_config['scatter_alpha'], s=80,
                   edgecolor=style_config['scatter_edge_color'], 
                   linewidth=style_config['scatter_edge_width'])
         
-        # Add trend line with RBC accent color
-        z = np.polyfit(data[x_col], data[y_col], 1)
-        p = np.poly1d(z)
-        ax.plot(data[x_col], p(data[x_col]), color=RBCBranding.COLORS['accent_yellow'], 
-               linestyle='--', linewidth=2, alpha=0.8)
+        # Add trend line with RBC accent color; a straight line only needs its two endpoints.
+        # Skipped when it is undefined: fewer than two points, constant x, or missing values.
+        x_ends = np.array([x_values.min(), x_values.max()]) if x_values.size >= 2 else None
+        if x_ends is not None and x_ends[1] > x_ends[0] and not np.isnan(y_values).any():
+            # Closed-form least-squares fit; cheaper than polyfit's lstsq for a degree-1 line
+            x_mean, y_mean = x_values.mean(), y_values.mean()
+            x_dev = x_values - x_mean
+            slope = np.dot(x_dev, y_values - y_mean) / np.dot(x_dev, x_dev)
+            ax.plot(x_ends, y_mean + slope * (x_ends - x_mean), color=RBCBranding.COLORS['accent_yellow'], 
+                   linestyle='--', linewidth=2, alpha=0.8)
         
         # Set labels and title with RBC fonts
         ax.set_xlabel(x_col, fontname=style_config['label_font'], 
@@ -204,13 +326,14 @@ class PowerPointHandler:
         
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('area')
-        RBCBranding.apply_rbc_theme_to_axis(ax, 'area')
+        RBCBranding.apply_rbc_theme_to_axis(ax, 'area', style_config)
         
         # Create area with RBC colors
         area_color = RBCBranding.COLORS['primary_blue']
-        ax.fill_between(data[x_col], data[y_col], color=area_color, 
+        x_values, y_values = self._mean_per_x(data, x_col, y_col)
+        ax.fill_between(x_values, y_values, color=area_color, 
                       alpha=style_config['area_alpha'])
-        ax.plot(data[x_col], data[y_col], color=area_color, 
+        ax.plot(x_values, y_values, color=area_color, 
                linewidth=style_config['line_width'])
         
         # Set labels and title with RBC fonts
@@ -222,9 +345,9 @@ class PowerPointHandler:
                    fontsize=style_config['title_size'], color=style_config['title_color'], weight='bold')
         
         # Format x-axis for dates
-        if data[x_col].dtype == 'datetime64[ns]':
-            fig = ax.figure
-            fig.autofmt_xdate()
+        if is_datetime64_any_dtype(data[x_col].dtype):
+            # Same rotation as fig.autofmt_xdate, minus its subplots_adjust (constrained layout handles spacing)
+            self._rotate_xticklabels(ax, 30)
     
     def _create_histogram(self, ax, data: pd.DataFrame, config: Dict):
         """Create histogram with RBC branding."""
@@ -233,10 +356,20 @@ class PowerPointHandler:
         
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('histogram')
-        RBCBranding.apply_rbc_theme_to_axis(ax, 'histogram')
+        RBCBranding.apply_rbc_theme_to_axis(ax, 'histogram', style_config)
+        
+        # Bin once with NumPy; an explicit data range makes np.histogram skip NaNs,
+        # so the column is never copied by dropna
+        values = data[col].to_numpy(dtype=float, na_value=np.nan)
+        lo, hi = (np.fmin.reduce(values), np.fmax.reduce(values)) if values.size else (np.nan, np.nan)
+        if np.isnan(lo):
+            values, value_range = values[:0], None
+        else:
+            value_range = (lo, hi)
+        counts, edges = np.histogram(values, bins=bins, range=value_range)
         
-        # Create histogram with RBC colors
-        ax.hist(data[col].dropna(), bins=bins, color=style_config['hist_color'], 
+        # Create histogram with RBC colors from the precomputed counts
+        ax.hist(edges[:-1], bins=edges, weights=counts, color=style_config['hist_color'], 
                alpha=style_config['hist_alpha'], 
                edgecolor=style_config['hist_edge_color'])
         
@@ -255,18 +388,21 @@ class PowerPointHandler:
         
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('bar')
-        RBCBranding.apply_rbc_theme_to_axis(ax, 'bar')
+        RBCBranding.apply_rbc_theme_to_axis(ax, 'bar', style_config)
         
         # Get RBC colors for each series
-        colors = RBCBranding.get_color_palette('categorical', len(y_cols))
-        
-        # Create stacked bars
-        bottom = np.zeros(len(data))
+        colors = _color_palette('categorical', len(y_cols))
+        
+        # Create stacked bars; each series sits on the running total of the ones before it
+        x = data[x_col]
+        x_values = x.to_numpy()
+        values = data[y_cols].to_numpy(dtype=float, na_value=np.nan)
+        bottoms = np.zeros_like(values)
+        np.cumsum(values[:, :-1], axis=1, out=bottoms[:, 1:])
         for i, y_col in enumerate(y_cols):
-            ax.bar(data[x_col], data[y_col], bottom=bottom, color=colors[i], 
+            ax.bar(x_values, values[:, i], bottom=bottoms[:, i], color=colors[i], 
                    edgecolor=style_config['edge_color'], linewidth=style_config['edge_width'],
                    label=y_col)
-            bottom += data[y_col]
         
         # Set labels and title with RBC fonts
         ax.set_xlabel(x_col, fontname=style_config['label_font'], 
@@ -284,9 +420,9 @@ class PowerPointHandler:
             text.set_fontsize(style_config['label_size']-1)
         
         # Rotate x-axis labels if needed
-        if len(data[x_col].unique()) > 5:
-            plt.xticks(rotation=45, ha='right', fontname=style_config['label_font'], 
-                      fontsize=style_config['label_size'])
+        if x.nunique(dropna=False) > 5:
+            self._rotate_xticklabels(ax, 45, fontname=style_config['label_font'],
+                                     fontsize=style_config['label_size'])
         
         # Format y-axis as percentage
         ax.set_ylim(0, 100)
@@ -300,23 +436,27 @@ class PowerPointHandler:
         
         # Get RBC styling
         style_config = RBCBranding.get_chart_style_config('area')
-        RBCBranding.apply_rbc_theme_to_axis(ax, 'area')
+        RBCBranding.apply_rbc_theme_to_axis(ax, 'area', style_config)
         
         # Get RBC colors for each series
-        colors = RBCBranding.get_color_palette('sequential', len(y_cols))
+        colors = _color_palette('sequential', len(y_cols))
         
         # Create stacked area chart (100% stacked)
-        # Normalize data to 100%
-        data_normalized = data.copy()
-        for y_col in y_cols:
-            data_normalized[y_col] = (data[y_col] / data[y_cols].sum(axis=1)) * 100
-        
-        # Create stacked areas
+        # Normalize data to 100% in place on a private copy; nansum matches pandas'
+        # skipna row totals
+        values = data[y_cols].to_numpy(dtype=float, na_value=np.nan, copy=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values, np.nansum(values, axis=1, keepdims=True), out=values)
+        values *= 100
+        
+        # Create stacked areas; each band runs from the previous running total to its own
+        x_values = data[x_col].to_numpy()
+        tops = np.cumsum(values, axis=1)
         bottom = np.zeros(len(data))
         for i, y_col in enumerate(y_cols):
-            ax.fill_between(data[x_col], bottom, bottom + data_normalized[y_col], 
+            ax.fill_between(x_values, bottom, tops[:, i], 
                          color=colors[i], alpha=style_config['area_alpha'], label=y_col)
-            bottom += data_normalized[y_col]
+            bottom = tops[:, i]
         
         # Set labels and title with RBC fonts
         ax.set_xlabel(x_col, fontname=style_config['label_font'], 
@@ -337,75 +477,53 @@ class PowerPointHandler:
         ax.set_ylim(0, 100)
         
         # Format x-axis for dates
-        if data[x_col].dtype == 'datetime64[ns]':
-            fig = ax.figure
-            fig.autofmt_xdate()
+        if is_datetime64_any_dtype(data[x_col].dtype):
+            # Same rotation as fig.autofmt_xdate, minus its subplots_adjust (constrained layout handles spacing)
+            self._rotate_xticklabels(ax, 30)
+    
+    def _set_title(self, slide, text: str, styled: bool = True):
+        """Set the slide title, adding a text box if the layout has no title placeholder."""
+        title_shape = slide.shapes.title
+        if title_shape is not None:
+            title_frame = title_shape.text_frame
+        else:
+            title_frame = slide.shapes.add_textbox(*_TITLE_BOX).text_frame
+        title_frame.text = text
+        
+        if styled:
+            self._apply_text_style(title_frame.paragraphs, _TITLE_FONT, _TITLE_PT, bold=True)
+    
+    @staticmethod
+    def _apply_text_style(paragraphs, font_name: str, size, bold: bool = None):
+        """Apply RBC font styling to every run of the given paragraphs."""
+        for paragraph in paragraphs:
+            for run in paragraph.runs:
+                font = run.font  # each .font access builds a new proxy
+                font.name = font_name
+                font.size = size
+                font.color.rgb = _TEXT_RGB
+                if bold is not None:
+                    font.bold = bold
     
     def add_slide_with_chart(self, data: pd.DataFrame, chart_config: Dict[str, Any], 
-                           title: str = None, slide_layout: int = 6) -> int:
-        """Add a new slide with chart to the presentation."""
+                           title: str = None, slide_layout: int = 6, chart_img: bytes = None) -> int:
+        """Add a new slide with chart to the presentation, rendering it unless `chart_img` is given."""
         if not self.presentation:
             self.load_template()
         
         # Add new slide
-        slide_layout = self.presentation.slide_layouts[slide_layout]
+        slide_layout = self._layouts[slide_layout]
         slide = self.presentation.slides.add_slide(slide_layout)
         
         # Set title with RBC styling
-        if title:
-            title_shape = slide.shapes.title
-            if title_shape is not None:
-                title_shape.text = title
-                # Apply RBC font styling
-                for paragraph in title_shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.name = RBCBranding.FONTS['heading']
-                        run.font.size = Pt(RBCBranding.FONT_SIZES['title'])
-                        run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-                        run.font.bold = True
-            else:
-                # Create a text box for title if no title placeholder
-                from pptx.util import Inches
-                title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(1))
-                title_frame = title_box.text_frame
-                title_frame.text = title
-                # Apply RBC font styling
-                for paragraph in title_frame.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.name = RBCBranding.FONTS['heading']
-                        run.font.size = Pt(RBCBranding.FONT_SIZES['title'])
-                        run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-                        run.font.bold = True
-        else:
-            title_shape = slide.shapes.title
-            if title_shape is not None:
-                title_shape.text = f"{chart_config['chart_type'].title()} Chart"
-                # Apply RBC font styling
-                for paragraph in title_shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.name = RBCBranding.FONTS['heading']
-                        run.font.size = Pt(RBCBranding.FONT_SIZES['title'])
-                        run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-                        run.font.bold = True
-            else:
-                # Create a text box for title if no title placeholder
-                from pptx.util import Inches
-                title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(1))
-                title_frame = title_box.text_frame
-                title_frame.text = f"{chart_config['chart_type'].title()} Chart"
-                # Apply RBC font styling
-                for paragraph in title_frame.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.name = RBCBranding.FONTS['heading']
-                        run.font.size = Pt(RBCBranding.FONT_SIZES['title'])
-                        run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-                        run.font.bold = True
+        self._set_title(slide, title or f"{chart_config['chart_type'].title()} Chart")
         
         # Create chart image
-        chart_img = self.create_chart_image(data, chart_config)
+        if chart_img is None:
+            chart_img = self.create_chart_image(data, chart_config)
         
         # Add chart image to slide
-        slide.shapes.add_picture(chart_img, Inches(1), Inches(1.5), Inches(8), Inches(5))
+        slide.shapes.add_picture(BytesIO(chart_img), *_CHART_BOX)
         
         return len(self.presentation.slides) - 1
     
@@ -414,32 +532,10 @@ class PowerPointHandler:
         if not self.presentation:
             self.load_template()
         
-        slide_layout = self.presentation.slide_layouts[1]  # Title and content
+        slide_layout = self._layouts[1]  # Title and content
         slide = self.presentation.slides.add_slide(slide_layout)
         
-        title_shape = slide.shapes.title
-        if title_shape is not None:
-            title_shape.text = title
-            # Apply RBC font styling to title
-            for paragraph in title_shape.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.name = RBCBranding.FONTS['heading']
-                    run.font.size = Pt(RBCBranding.FONT_SIZES['title'])
-                    run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-                    run.font.bold = True
-        else:
-            # Create a text box for title if no title placeholder
-            from pptx.util import Inches
-            title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(1))
-            title_frame = title_box.text_frame
-            title_frame.text = title
-            # Apply RBC font styling
-            for paragraph in title_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.name = RBCBranding.FONTS['heading']
-                    run.font.size = Pt(RBCBranding.FONT_SIZES['title'])
-                    run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-                    run.font.bold = True
+        self._set_title(slide, title)
         
         # Add summary content
         content_shape = slide.placeholders[1]
@@ -447,84 +543,115 @@ class PowerPointHandler:
         tf.clear()
         
         # Add summary points with RBC styling
-        p = tf.add_paragraph()
-        p.text = f"Dataset Shape: {data_summary['shape'][0]} rows × {data_summary['shape'][1]} columns"
-        p.level = 0
-        for run in p.runs:
-            run.font.name = RBCBranding.FONTS['body']
-            run.font.size = Pt(RBCBranding.FONT_SIZES['body'])
-            run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-        
-        p = tf.add_paragraph()
-        p.text = f"Numeric Columns: {len(data_summary['numeric_columns'])}"
-        p.level = 0
-        for run in p.runs:
-            run.font.name = RBCBranding.FONTS['body']
-            run.font.size = Pt(RBCBranding.FONT_SIZES['body'])
-            run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-        
-        p = tf.add_paragraph()
-        p.text = f"Categorical Columns: {len(data_summary['categorical_columns'])}"
-        p.level = 0
-        for run in p.runs:
-            run.font.name = RBCBranding.FONTS['body']
-            run.font.size = Pt(RBCBranding.FONT_SIZES['body'])
-            run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
-        
+        lines = [
+            f"Dataset Shape: {data_summary['shape'][0]} rows × {data_summary['shape'][1]} columns",
+            f"Numeric Columns: {len(data_summary['numeric_columns'])}",
+            f"Categorical Columns: {len(data_summary['categorical_columns'])}",
+        ]
         if data_summary['missing_values']:
             total_missing = sum(data_summary['missing_values'].values())
+            lines.append(f"Missing Values: {total_missing}")
+        
+        paragraphs = []
+        for line in lines:
             p = tf.add_paragraph()
-            p.text = f"Missing Values: {total_missing}"
+            p.text = line
             p.level = 0
-            for run in p.runs:
-                run.font.name = RBCBranding.FONTS['body']
-                run.font.size = Pt(RBCBranding.FONT_SIZES['body'])
-                run.font.color.rgb = RGBColor(*RBCBranding.RGB_COLORS['dark_blue'])
+            paragraphs.append(p)
+        self._apply_text_style(paragraphs, _BODY_FONT, _BODY_PT)
         
         return len(self.presentation.slides) - 1
     
-    def save_presentation(self, output_path: str):
-        """Save the presentation to file."""
+    def _render_chart_images(self, data: pd.DataFrame, chart_configs: List[Dict[str, Any]]) -> List[bytes]:
+        """
+        Render every chart image up front in worker processes, when `max_workers` asks for them.
+        
+        Each worker receives `data` once through the pool initializer rather than with
+        every chart. Returns None placeholders when rendering is left to the slides.
+        """
+        num_workers = min(self.max_workers or 1, len(chart_configs))
+        if num_workers <= 1:
+            return [None] * len(chart_configs)
+        
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_chart_worker,
+                                 initargs=(data,)) as executor:
+            return list(executor.map(_render_chart_in_worker, chart_configs))
+    
+    def save_presentation(self, output_path: Union[str, BinaryIO]):
+        """Save the presentation to a file path, or into a writable binary file object such as BytesIO."""
         if not self.presentation:
             raise ValueError("No presentation to save. Create slides first.")
         
-        self.presentation.save(output_path)
+        if hasattr(output_path, 'write'):
+            self.presentation.save(output_path)
+            return
+        
+        # Build the zip in memory, then write it in one go; the temporary file is only
+        # renamed over `output_path` once complete, so a failed save leaves no partial file
+        buffer = BytesIO()
+        self.presentation.save(buffer)
+        tmp_path = Path(f"{output_path}.tmp")
+        try:
+            tmp_path.write_bytes(buffer.getvalue())
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
-    def create_presentation_from_data(self, data: pd.DataFrame, chart_configs: List[Dict[str, Any]], 
-                                    title: str = "Data Visualization Report") -> str:
-        """Create a complete presentation from data and chart configurations."""
+    def start_presentation(self, title: str = "Data Visualization Report"):
+        """Start a new presentation from the template, with a title slide."""
         self.load_template()
         
-        # Add title slide
-        title_slide_layout = self.presentation.slide_layouts[0]
+        title_slide_layout = self._layouts[0]
         slide = self.presentation.slides.add_slide(title_slide_layout)
-        title_shape = slide.shapes.title
-        if title_shape is not None:
-            title_shape.text = title
-        else:
-            # Create a text box for title if no title placeholder
-            from pptx.util import Inches
-            title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(1))
-            title_frame = title_box.text_frame
-            title_frame.text = title
+        self._set_title(slide, title, styled=False)
         
         subtitle_shape = slide.placeholders[1] if len(slide.placeholders) > 1 else None
         if subtitle_shape is not None:
-            subtitle_shape.text = f"Generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}"
+            subtitle_shape.text = f"Generated on {datetime.now():%Y-%m-%d %H:%M}"
+    
+    def create_presentation_from_data(self, data: pd.DataFrame, chart_configs: List[Dict[str, Any]], 
+                                    title: str = "Data Visualization Report",
+                                    output_path: Optional[str] = None,
+                                    data_summary: Optional[Dict[str, Any]] = None) -> str:
+        """Create a complete presentation from data and chart configurations.
+        
+        Saved to `output_path` (a path or a writable binary file object), or to a file
+        name derived from `title` when not given.
+        The summary slide uses `data_summary` (a DataAnalyzer.analyze_data result) when the
+        caller already has one, instead of analyzing `data` again.
+        """
+        self.start_presentation(title)
         
         # Add summary slide
-        from data_analyzer import DataAnalyzer
-        analyzer = DataAnalyzer()
-        data_summary = analyzer.analyze_data(data)
+        if data_summary is None:
+            from data_analyzer import DataAnalyzer
+            data_summary = DataAnalyzer().analyze_data(data)
         self.add_summary_slide(data_summary)
         
         # Add chart slides
-        for i, config in enumerate(chart_configs):
+        chart_images = self._render_chart_images(data, chart_configs)
+        for i, (config, chart_img) in enumerate(zip(chart_configs, chart_images)):
             chart_title = f"{config['chart_type'].title()} Chart {i+1}"
-            self.add_slide_with_chart(data, config, chart_title)
+            self.add_slide_with_chart(data, config, chart_title, chart_img=chart_img)
         
         # Save presentation
-        output_path = f"{title.replace(' ', '_')}.pptx"
+        if output_path is None:
+            output_path = default_output_path(title)
         self.save_presentation(output_path)
         
         return output_path
+
+# Per-process state for parallel chart rendering, set by _init_chart_worker
+_worker_data = None
+_worker_handler = None
+
+def _init_chart_worker(data: pd.DataFrame):
+    """Pool initializer: keep the presentation's data and a handler for this worker's charts."""
+    global _worker_data, _worker_handler
+    _worker_data = data
+    _worker_handler = PowerPointHandler(max_workers=1)
+
+def _render_chart_in_worker(chart_config: Dict[str, Any]) -> bytes:
+    """Render one chart image in a pool worker and return the PNG bytes."""
+    return _worker_handler.create_chart_image(_worker_data, chart_config)
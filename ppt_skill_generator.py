@@ -1,8 +1,32 @@
 import pandas as pd
 import os
-from typing import Dict, List, Any, Optional, Union
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
 from data_analyzer import DataAnalyzer, ChartType
-from ppt_handler import PowerPointHandler
+from ppt_handler import PowerPointHandler, default_output_path
+
+# Config keys naming the data columns each chart type reads
+CHART_COLUMN_KEYS = {
+    'bar': ('x_column', 'y_column'),
+    'line': ('x_column', 'y_column'),
+    'area': ('x_column', 'y_column'),
+    'scatter': ('x_column', 'y_column'),
+    'pie': ('labels_column', 'values_column'),
+    'histogram': ('column',),
+    'stacked_bar': ('x_column', 'y_columns'),
+    'stacked_area': ('x_column', 'y_columns'),
+}
+
+# Chart type names accepted by create_custom_chart, mapped to their enum members
+CHART_TYPES = {chart_type.value: chart_type for chart_type in ChartType}
+_INVALID_CHART_TYPE = f"Invalid chart type: {{}}. Valid types: {list(CHART_TYPES)}"
+
+def _downcast_integers(data: pd.DataFrame) -> pd.DataFrame:
+    """Store each integer column in the smallest integer type that holds its values (lossless)."""
+    for col in data.select_dtypes(include='integer').columns:
+        data[col] = pd.to_numeric(data[col], downcast='integer')
+    return data
 
 class PowerPointSkillGenerator:
     def __init__(self, template_path: str = None):
@@ -16,33 +40,106 @@ class PowerPointSkillGenerator:
         self.ppt_handler = PowerPointHandler(template_path)
         self.data = None
         self.analysis = None
+        self._loaded_key = None  # _source_key of the source behind self.data
     
-    def load_data(self, data_source: Union[str, pd.DataFrame], **kwargs) -> None:
+    def load_data(self, data_source: Union[str, pd.DataFrame], columns: List[str] = None,
+                  downcast: bool = False, skip_analysis: bool = False, reuse_analysis: bool = False,
+                  **kwargs) -> None:
         """
         Load data from various sources.
         
+        Loading the file that is already loaded again (unchanged on disk and with the same
+        arguments) keeps the current data and analysis instead of re-reading and re-analyzing it.
+        A DataFrame is re-analyzed on every call unless `reuse_analysis` is set.
+        
         Args:
-            data_source: Path to file (CSV, Excel, JSON) or pandas DataFrame
-            **kwargs: Additional arguments for pandas read functions
+            data_source: Path to file (CSV, Excel, JSON, Parquet, Feather) or pandas DataFrame
+            columns: Only load these columns (optional); CSV, Excel, Parquet and Feather
+                files skip parsing the others entirely
+            downcast: Store the integer columns of a loaded file in the smallest integer
+                type that holds them (e.g. int16 credit scores), cutting the memory the
+                analysis and charts scan; values are unchanged
+            skip_analysis: Leave `self.analysis` as None instead of analyzing the data now;
+                methods that need it compute it on first use
+            reuse_analysis: Keep the current analysis when `data_source` is the DataFrame
+                object already loaded, with the same shape and dtypes. Only set this when the
+                frame has not been modified in place since it was loaded, since such edits
+                don't change the fingerprint
+            **kwargs: Additional arguments for pandas read functions; for CSV, `chunksize`
+                parses the file in chunks of that many rows (bounding parser memory on large
+                files) and assembles them into one DataFrame
         """
+        if columns is not None:
+            columns = list(dict.fromkeys(columns))
+        source_key = self._source_key(data_source, columns, downcast, kwargs)
+        reusable = reuse_analysis or not isinstance(data_source, pd.DataFrame)
+        if reusable and source_key is not None and source_key == self._loaded_key and self.data is not None:
+            if not skip_analysis:
+                self._ensure_analysis()
+            return
+        
         if isinstance(data_source, pd.DataFrame):
-            self.data = data_source
+            self.data = data_source if columns is None else data_source[columns]
         elif isinstance(data_source, str):
             file_ext = os.path.splitext(data_source)[1].lower()
             
+            # Column projection, in each reader's own terms (a new dict: source_key holds kwargs)
+            if columns is not None and file_ext in ('.csv', '.xlsx', '.xls'):
+                kwargs = {**kwargs, 'usecols': columns}
+            elif columns is not None and file_ext in ('.parquet', '.feather'):
+                kwargs = {**kwargs, 'columns': columns}
+            
             if file_ext == '.csv':
-                self.data = pd.read_csv(data_source, **kwargs)
+                if kwargs.get('chunksize'):
+                    with pd.read_csv(data_source, **kwargs) as reader:
+                        self.data = pd.concat(reader, ignore_index=True)
+                else:
+                    self.data = pd.read_csv(data_source, **kwargs)
             elif file_ext in ['.xlsx', '.xls']:
                 self.data = pd.read_excel(data_source, **kwargs)
             elif file_ext == '.json':
                 self.data = pd.read_json(data_source, **kwargs)
+                if columns is not None:
+                    self.data = self.data[columns]
+            elif file_ext == '.parquet':
+                self.data = pd.read_parquet(data_source, **kwargs)
+            elif file_ext == '.feather':
+                self.data = pd.read_feather(data_source, **kwargs)
             else:
                 raise ValueError(f"Unsupported file format: {file_ext}")
+            
+            if downcast:
+                self.data = _downcast_integers(self.data)
         else:
             raise ValueError("data_source must be a file path or pandas DataFrame")
         
         # Analyze the loaded data
-        self.analysis = self.data_analyzer.analyze_data(self.data)
+        self.analysis = None if skip_analysis else self.data_analyzer.analyze_data(self.data)
+        self._loaded_key = source_key
+    
+    def _ensure_analysis(self) -> Dict[str, Any]:
+        """The analysis of the loaded data, computed now if load_data skipped it."""
+        if self.analysis is None:
+            self.analysis = self.data_analyzer.analyze_data(self.data)
+        return self.analysis
+    
+    @staticmethod
+    def _source_key(data_source: Union[str, pd.DataFrame], columns: Optional[List[str]],
+                    downcast: bool, kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """Identify a load: a file by path, modification time, size and load arguments;
+        a whole DataFrame by identity, shape and dtypes (self.data keeps it alive, so its id is
+        stable). Column subsets of a DataFrame are new objects each time and are not keyed."""
+        if isinstance(data_source, pd.DataFrame):
+            if columns is not None:
+                return None
+            return (id(data_source), data_source.shape, tuple(data_source.dtypes))
+        if not isinstance(data_source, str):
+            return None
+        try:
+            stat = os.stat(data_source)
+        except OSError:
+            return None
+        return (os.path.abspath(data_source), stat.st_mtime_ns, stat.st_size, columns, downcast, kwargs)
     
     def recommend_visualizations(self, target_column: str = None, max_charts: int = 5) -> List[Dict[str, Any]]:
         """
@@ -57,64 +154,75 @@ class PowerPointSkillGenerator:
         """
         if self.data is None:
             raise ValueError("No data loaded. Call load_data() first.")
+        self._ensure_analysis()
         
+        # Configs are built lazily, so those past max_charts are never computed
+        return list(islice(self._iter_recommendations(target_column), max_charts))
+    
+    def _iter_recommendations(self, target_column: str = None):
+        """Yield distinct chart configurations, primary recommendation first."""
         recommendations = []
         
         # Get primary recommendation
-        primary_chart, confidence = self.data_analyzer.recommend_chart_type(self.data, target_column)
-        primary_config = self.data_analyzer.get_chart_config(self.data, primary_chart, target_column)
+        primary_chart, confidence = self.data_analyzer.recommend_chart_type(self.data, target_column, self.analysis)
+        primary_config = self.data_analyzer.get_chart_config(self.data, primary_chart, target_column, self.analysis)
         primary_config['confidence'] = confidence
         recommendations.append(primary_config)
+        yield primary_config
         
         # Get additional recommendations for different perspectives
         if len(self.analysis['numeric_columns']) >= 2:
             # Add scatter plot for relationships
-            scatter_config = self.data_analyzer.get_chart_config(self.data, ChartType.SCATTER)
+            scatter_config = self.data_analyzer.get_chart_config(self.data, ChartType.SCATTER, analysis=self.analysis)
             scatter_config['confidence'] = 0.7
             if scatter_config not in recommendations:
                 recommendations.append(scatter_config)
+                yield scatter_config
         
         if len(self.analysis['categorical_columns']) >= 1 and len(self.analysis['numeric_columns']) >= 1:
             # Add bar chart for categorical comparison
-            bar_config = self.data_analyzer.get_chart_config(self.data, ChartType.BAR)
+            bar_config = self.data_analyzer.get_chart_config(self.data, ChartType.BAR, analysis=self.analysis)
             bar_config['confidence'] = 0.8
             if bar_config not in recommendations:
                 recommendations.append(bar_config)
+                yield bar_config
         
         if len(self.analysis['numeric_columns']) == 1:
             # Add histogram for distribution
-            hist_config = self.data_analyzer.get_chart_config(self.data, ChartType.HISTOGRAM)
+            hist_config = self.data_analyzer.get_chart_config(self.data, ChartType.HISTOGRAM, analysis=self.analysis)
             hist_config['confidence'] = 0.6
             if hist_config not in recommendations:
                 recommendations.append(hist_config)
-        
-        return recommendations[:max_charts]
+                yield hist_config
     
     def create_presentation(self, data_source: Union[str, pd.DataFrame], 
                           output_path: str = None, title: str = "Data Visualization Report",
                           template_path: str = None, target_column: str = None,
-                          auto_recommend: bool = True, chart_configs: List[Dict] = None) -> str:
+                          auto_recommend: bool = True, chart_configs: List[Dict] = None,
+                          columns: List[str] = None) -> str:
         """
         Create a PowerPoint presentation with data visualizations.
         
         Args:
             data_source: Path to data file or pandas DataFrame
-            output_path: Output file path (optional)
+            output_path: Output file path or writable binary file object, e.g. BytesIO (optional)
             title: Presentation title
             template_path: PowerPoint template path (optional)
             target_column: Specific column to focus on (optional)
             auto_recommend: Whether to automatically recommend charts
             chart_configs: Custom chart configurations (overrides auto_recommend)
+            columns: Only load and analyze these columns (optional)
             
         Returns:
             Path to the generated presentation
         """
         # Load data
-        self.load_data(data_source)
+        self.load_data(data_source, columns=columns)
         
-        # Initialize PPT handler with template
+        # Point the existing handler at the template so its settings (e.g. max_workers) carry
+        # over; start_presentation loads it once
         if template_path:
-            self.ppt_handler = PowerPointHandler(template_path)
+            self.ppt_handler.template_path = template_path
         
         # Get chart configurations
         if chart_configs is None:
@@ -122,23 +230,18 @@ class PowerPointSkillGenerator:
                 chart_configs = self.recommend_visualizations(target_column)
             else:
                 # Use single best recommendation
-                best_chart, _ = self.data_analyzer.recommend_chart_type(self.data, target_column)
-                chart_configs = [self.data_analyzer.get_chart_config(self.data, best_chart, target_column)]
-        
-        # Create presentation
-        if output_path is None:
-            output_path = f"{title.replace(' ', '_')}.pptx"
-        
-        self.ppt_handler.create_presentation_from_data(self.data, chart_configs, title)
-        
-        # Move to final output path if different
-        if output_path != f"{title.replace(' ', '_')}.pptx":
-            os.rename(f"{title.replace(' ', '_')}.pptx", output_path)
-        
-        return output_path
+                best_chart, _ = self.data_analyzer.recommend_chart_type(self.data, target_column, self.analysis)
+                chart_configs = [self.data_analyzer.get_chart_config(self.data, best_chart, target_column,
+                                                                     self.analysis)]
+        
+        # Create presentation, written straight to its final path
+        return self.ppt_handler.create_presentation_from_data(self.data, chart_configs, title,
+                                                              output_path=output_path,
+                                                              data_summary=self.analysis)
     
     def create_custom_chart(self, chart_type: str, data_source: Union[str, pd.DataFrame],
-                           config: Dict[str, Any], output_path: str = None) -> str:
+                           config: Dict[str, Any], output_path: str = None,
+                           columns: Union[List[str], str] = None) -> str:
         """
         Create a presentation with a single custom chart.
         
@@ -146,37 +249,114 @@ class PowerPointSkillGenerator:
             chart_type: Type of chart ('bar', 'line', 'pie', 'scatter', 'area', 'histogram')
             data_source: Path to data file or pandas DataFrame
             config: Chart configuration
-            output_path: Output file path (optional)
+            output_path: Output file path or writable binary file object, e.g. BytesIO (optional)
+            columns: Only load these columns (optional). 'auto' loads just the columns
+                `config` charts when it names all of them; the summary slide then describes
+                those columns only. By default every column is loaded and summarized
             
         Returns:
             Path to the generated presentation
         """
-        # Load data
-        self.load_data(data_source)
-        
-        # Validate chart type
-        try:
-            chart_enum = ChartType(chart_type)
-        except ValueError:
-            raise ValueError(f"Invalid chart type: {chart_type}. Valid types: {[t.value for t in ChartType]}")
-        
-        # Get configuration
-        full_config = self.data_analyzer.get_chart_config(self.data, chart_enum)
-        full_config.update(config)
+        full_config, analysis = self._custom_chart_config(chart_type, data_source, config, columns)
         
         # Create presentation
         title = f"{chart_type.title()} Chart Analysis"
         if output_path is None:
             output_path = f"{chart_type}_chart.pptx"
         
-        self.ppt_handler.create_presentation_from_data(self.data, [full_config], title)
+        return self.ppt_handler.create_presentation_from_data(self.data, [full_config], title,
+                                                              output_path=output_path,
+                                                              data_summary=analysis)
+    
+    def new_presentation(self, title: str = "Data Visualization Report") -> None:
+        """
+        Start a presentation to fill with append_chart and write once with save.
         
-        # Move to final output path if different
-        if output_path != f"{title.replace(' ', '_')}.pptx":
-            os.rename(f"{title.replace(' ', '_')}.pptx", output_path)
+        Args:
+            title: Title slide text
+        """
+        self.ppt_handler.start_presentation(title)
+    
+    def append_chart(self, chart_type: str, data_source: Union[str, pd.DataFrame],
+                     config: Dict[str, Any], title: str = None,
+                     columns: Union[List[str], str] = None) -> int:
+        """
+        Add one custom chart slide to the presentation started with new_presentation.
+        
+        Args:
+            chart_type: Type of chart, as for create_custom_chart
+            data_source: Path to data file or pandas DataFrame
+            config: Chart configuration
+            title: Slide title (optional; defaults to "<Type> Chart Analysis")
+            columns: Only load these columns (optional, see create_custom_chart)
+            
+        Returns:
+            Index of the new slide
+        """
+        if self.ppt_handler.presentation is None:
+            raise ValueError("No presentation started. Call new_presentation() first.")
         
+        full_config, _ = self._custom_chart_config(chart_type, data_source, config, columns)
+        return self.ppt_handler.add_slide_with_chart(self.data, full_config,
+                                                     title or f"{chart_type.title()} Chart Analysis")
+    
+    def save(self, output_path: str) -> str:
+        """Write the presentation built with append_chart to `output_path` (a path or BytesIO) and return it."""
+        self.ppt_handler.save_presentation(output_path)
         return output_path
     
+    def create_chart_deck(self, charts: List[Dict[str, Any]], title: str = "Data Visualization Report",
+                          output_path: str = None) -> str:
+        """
+        Create one presentation with a slide per custom chart, written once.
+        
+        Args:
+            charts: append_chart keyword arguments for each chart, in slide order
+            title: Title slide text
+            output_path: Output file path or writable binary file object, e.g. BytesIO (optional)
+            
+        Returns:
+            Path to the generated presentation
+        """
+        self.new_presentation(title)
+        for chart in charts:
+            self.append_chart(**chart)
+        return self.save(output_path or default_output_path(title))
+    
+    def _custom_chart_config(self, chart_type: str, data_source: Union[str, pd.DataFrame],
+                             config: Dict[str, Any],
+                             columns: Union[List[str], str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Load the data for one custom chart; return its full config and the light analysis behind it."""
+        # Validate chart type before loading anything
+        chart_enum = CHART_TYPES.get(chart_type)
+        if chart_enum is None:
+            raise ValueError(_INVALID_CHART_TYPE.format(chart_type))
+        
+        if columns == 'auto':
+            columns = self._chart_columns(chart_type, config)
+        
+        # Load data; a single given chart needs no recommendation, so skip the full analysis
+        self.load_data(data_source, columns=columns, skip_analysis=True)
+        
+        # Column defaults and the summary slide only need column types and null counts
+        analysis = self.analysis or self.data_analyzer.analyze_data(self.data, include_unique_counts=False)
+        
+        full_config = self.data_analyzer.get_chart_config(self.data, chart_enum, analysis=analysis)
+        full_config.update(config)
+        return full_config, analysis
+    
+    @staticmethod
+    def _chart_columns(chart_type: str, config: Dict[str, Any]) -> Optional[List[str]]:
+        """The data columns `config` charts, or None if it leaves any to be inferred."""
+        keys = CHART_COLUMN_KEYS.get(chart_type)
+        if keys is None or any(key not in config for key in keys):
+            return None
+        columns = []
+        for key in keys:
+            value = config[key]
+            columns.extend(value if isinstance(value, (list, tuple)) else [value])
+        return columns
+    
     def get_data_insights(self) -> Dict[str, Any]:
         """
         Get detailed insights about the loaded data.
@@ -187,55 +367,118 @@ class PowerPointSkillGenerator:
         if self.data is None:
             raise ValueError("No data loaded. Call load_data() first.")
         
-        insights = self.analysis.copy()
+        insights = self._ensure_analysis().copy()
+        insights.update(self.data_analyzer.analyze_stats(self.data, insights['numeric_columns']))
         
-        # Add additional insights
+        # Add additional insights; missing counts come from the per-column totals already
+        # in the analysis rather than another isna() pass over every cell
+        primary_chart, confidence = self.data_analyzer.recommend_chart_type(self.data, analysis=self.analysis)
+        n_rows, n_cols = insights['shape']
+        total_missing = sum(insights['missing_values'].values())
         insights['recommendations'] = {
-            'primary_chart': self.data_analyzer.recommend_chart_type(self.data)[0].value,
-            'confidence': self.data_analyzer.recommend_chart_type(self.data)[1],
+            'primary_chart': primary_chart.value,
+            'confidence': confidence,
             'data_quality': {
-                'completeness': (1 - sum(insights['missing_values'].values()) / (insights['shape'][0] * insights['shape'][1])) * 100,
-                'numeric_ratio': len(insights['numeric_columns']) / insights['shape'][1] * 100,
-                'categorical_ratio': len(insights['categorical_columns']) / insights['shape'][1] * 100
+                'completeness': (1 - total_missing / (n_rows * n_cols)) * 100,
+                'numeric_ratio': len(insights['numeric_columns']) / n_cols * 100,
+                'categorical_ratio': len(insights['categorical_columns']) / n_cols * 100
             }
         }
         
         return insights
     
     def batch_process(self, data_files: List[str], output_dir: str = "output", 
-                     template_path: str = None) -> List[str]:
+                     template_path: str = None, max_workers: int = None,
+                     use_processes: bool = True) -> List[str]:
         """
         Process multiple data files and create presentations.
         
+        Files are independent, so they are processed in parallel. Chart rendering
+        is CPU-bound, so a process pool is used by default; pass
+        `use_processes=False` for a thread pool when file I/O dominates.
+        
         Args:
             data_files: List of data file paths
             output_dir: Directory to save presentations
             template_path: PowerPoint template path (optional)
+            max_workers: Number of parallel workers (defaults to the CPU count;
+                1 processes the files sequentially in this process)
+            use_processes: Use worker processes (True) or threads (False)
             
         Returns:
             List of generated presentation paths
         """
+        names = [os.path.splitext(os.path.basename(file_path))[0] for file_path in data_files]
+        return self._run_batch(names, data_files, output_dir, template_path, max_workers, use_processes)
+    
+    def batch_process_dataframes(self, frames: Dict[str, pd.DataFrame], output_dir: str = "output",
+                                 template_path: str = None, max_workers: int = None,
+                                 use_processes: bool = True) -> List[str]:
+        """
+        Create one presentation per in-memory DataFrame, without writing inputs to disk.
+        
+        Args:
+            frames: Mapping of dataset name to DataFrame; the name is used for the
+                slide title and the output file name
+            output_dir: Directory to save presentations
+            template_path: PowerPoint template path (optional)
+            max_workers: Number of parallel workers (see batch_process)
+            use_processes: Use worker processes (True) or threads (False)
+            
+        Returns:
+            List of generated presentation paths
+        """
+        return self._run_batch(list(frames), list(frames.values()), output_dir, template_path,
+                               max_workers, use_processes)
+    
+    def _run_batch(self, names: List[str], data_sources: List[Union[str, pd.DataFrame]], output_dir: str,
+                   template_path: str, max_workers: int, use_processes: bool) -> List[str]:
+        """Create a presentation per data source, in parallel, and report each result."""
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        generated_files = []
+        num_workers = min(max_workers or os.cpu_count() or 1, len(data_sources))
+        # Workers build their own generators, so hand them the template this one was built with
+        template_path = template_path or self.ppt_handler.template_path
+        jobs = (names, data_sources, [output_dir] * len(names), [template_path] * len(names))
+        
+        if num_workers <= 1:
+            results = list(map(_process_one, *jobs))
+        else:
+            executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            with executor_class(max_workers=num_workers) as executor:
+                results = list(executor.map(_process_one, *jobs))
         
-        for file_path in data_files:
-            try:
-                file_name = os.path.splitext(os.path.basename(file_path))[0]
-                output_path = os.path.join(output_dir, f"{file_name}_analysis.pptx")
-                
-                self.create_presentation(
-                    data_source=file_path,
-                    output_path=output_path,
-                    title=f"{file_name} Analysis",
-                    template_path=template_path
-                )
-                
+        generated_files = []
+        for name, data_source, (output_path, error) in zip(names, data_sources, results):
+            if error is None:
                 generated_files.append(output_path)
                 print(f"Generated: {output_path}")
-                
-            except Exception as e:
-                print(f"Error processing {file_path}: {str(e)}")
+            else:
+                print(f"Error processing {data_source if isinstance(data_source, str) else name}: {error}")
         
         return generated_files
+
+def _process_one(name: str, data_source: Union[str, pd.DataFrame], output_dir: str,
+                 template_path: str = None):
+    """
+    Create the presentation for a single data source (picklable batch worker).
+    
+    Returns:
+        Tuple of (output_path, error message or None)
+    """
+    output_path = os.path.join(output_dir, f"{name}_analysis.pptx")
+    
+    try:
+        generator = PowerPointSkillGenerator()
+        generator.ppt_handler.max_workers = 1  # batch workers already run one file each
+        generator.create_presentation(
+            data_source=data_source,
+            output_path=output_path,
+            title=f"{name} Analysis",
+            template_path=template_path
+        )
+    except Exception as e:
+        return output_path, str(e)
+    
+    return output_path, None
@@ -4,8 +4,6 @@ Contains official RBC colors, fonts, and styling guidelines
 """
 
 from typing import Dict, List, Tuple
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 class RBCBranding:
     """RBC Brand Guidelines and Configuration"""
@@ -65,6 +63,30 @@ class RBCBranding:
         'categorical': ['#005DAA', '#FFD200', '#666666', '#CCCCCC', '#003D73', '#FF9400', '#4DA7FF', '#FFB300'],
     }
     
+    # matplotlib rcParams applied by setup_matplotlib_style
+    _RCPARAMS = {
+        'font.family': 'sans-serif',
+        'font.sans-serif': FONTS['primary'],
+        'font.size': FONT_SIZES['body'],
+        'axes.titlesize': FONT_SIZES['heading'],
+        'axes.labelsize': FONT_SIZES['axis_label'],
+        'xtick.labelsize': FONT_SIZES['data_label'],
+        'ytick.labelsize': FONT_SIZES['data_label'],
+        'legend.fontsize': FONT_SIZES['legend'],
+        'figure.titlesize': FONT_SIZES['title'],
+        'axes.titleweight': 'bold',
+        'axes.labelweight': 'normal',
+        'text.color': COLORS['dark_blue'],
+        'axes.labelcolor': COLORS['dark_blue'],
+        'xtick.color': COLORS['dark_blue'],
+        'ytick.color': COLORS['dark_blue'],
+        'axes.edgecolor': COLORS['gray_medium'],
+        'axes.facecolor': COLORS['white'],
+        'figure.facecolor': COLORS['white'],
+        'savefig.facecolor': COLORS['white'],
+        'savefig.edgecolor': 'none',
+    }
+    
     @classmethod
     def get_color_palette(cls, palette_type: str = 'primary', n_colors: int = 5) -> List[str]:
         """Get a color palette for charts"""
@@ -82,36 +104,30 @@ class RBCBranding:
     @classmethod
     def setup_matplotlib_style(cls):
         """Configure matplotlib with RBC branding"""
+        # Imported here so reading the brand constants does not load pyplot and seaborn
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         # Set color palette
         sns.set_palette(cls.CHART_PALETTES['primary'])
         
         # Set default parameters
-        plt.rcParams.update({
-            'font.family': 'sans-serif',
-            'font.sans-serif': cls.FONTS['primary'],
-            'font.size': cls.FONT_SIZES['body'],
-            'axes.titlesize': cls.FONT_SIZES['heading'],
-            'axes.labelsize': cls.FONT_SIZES['axis_label'],
-            'xtick.labelsize': cls.FONT_SIZES['data_label'],
-            'ytick.labelsize': cls.FONT_SIZES['data_label'],
-            'legend.fontsize': cls.FONT_SIZES['legend'],
-            'figure.titlesize': cls.FONT_SIZES['title'],
-            'axes.titleweight': 'bold',
-            'axes.labelweight': 'normal',
-            'text.color': cls.COLORS['dark_blue'],
-            'axes.labelcolor': cls.COLORS['dark_blue'],
-            'xtick.color': cls.COLORS['dark_blue'],
-            'ytick.color': cls.COLORS['dark_blue'],
-            'axes.edgecolor': cls.COLORS['gray_medium'],
-            'axes.facecolor': cls.COLORS['white'],
-            'figure.facecolor': cls.COLORS['white'],
-            'savefig.facecolor': cls.COLORS['white'],
-            'savefig.edgecolor': 'none',
-        })
+        plt.rcParams.update(cls._RCPARAMS)
     
     @classmethod
     def get_chart_style_config(cls, chart_type: str) -> Dict:
-        """Get chart-specific styling configuration"""
+        """Get chart-specific styling configuration
+        
+        Configs are built once, when the module is imported; each call returns a copy
+        (including its lists and dicts) that the caller is free to modify.
+        """
+        config = _CHART_STYLE_CONFIGS.get(chart_type, _CHART_STYLE_CONFIGS[None])
+        return {key: value.copy() if isinstance(value, (list, dict)) else value
+                for key, value in config.items()}
+    
+    @classmethod
+    def _build_chart_style_config(cls, chart_type: str) -> Dict:
+        """Build the styling configuration for chart_type (the base config for unknown types)"""
         base_config = {
             'title_font': cls.FONTS['heading'],
             'title_size': cls.FONT_SIZES['heading'],
@@ -154,6 +170,7 @@ class RBCBranding:
             base_config.update({
                 'area_colors': cls.get_color_palette('sequential', 5),
                 'area_alpha': 0.7,
+                'line_width': 2.5,
             })
         elif chart_type == 'histogram':
             base_config.update({
@@ -176,9 +193,10 @@ class RBCBranding:
         return base_config
     
     @classmethod
-    def apply_rbc_theme_to_axis(cls, ax, chart_type: str):
-        """Apply RBC styling to matplotlib axis"""
-        config = cls.get_chart_style_config(chart_type)
+    def apply_rbc_theme_to_axis(cls, ax, chart_type: str, config: Dict = None):
+        """Apply RBC styling to matplotlib axis, using `config` if already resolved for chart_type"""
+        if config is None:
+            config = cls.get_chart_style_config(chart_type)
         
         # Set spine colors
         for spine in ax.spines.values():
@@ -200,3 +218,9 @@ class RBCBranding:
         ax.yaxis.label.set_color(config['label_color'])
         
         return config
+
+
+# Precomputed style configs, keyed by chart type; None holds the base config for other types
+_CHART_STYLE_CONFIGS = {chart_type: RBCBranding._build_chart_style_config(chart_type)
+                        for chart_type in (None, 'bar', 'line', 'pie', 'scatter', 'area', 'histogram',
+                                           'stacked_bar', 'stacked_area')}
@@ -0,0 +1,35 @@
+"""
+Helpers shared by the test scripts: sample dates, output listing and archiving
+"""
+
+import os
+import tarfile
+import pandas as pd
+
+# Month-end dates of the sample year, shared by every dataset the test scripts build
+MONTHS_2023 = pd.date_range(start='2023-01-01', end='2023-12-31', freq='ME')
+
+def skill_generator_class():
+    """PowerPointSkillGenerator, imported on first use so --info-only runs skip loading the
+    chart and slide libraries."""
+    from ppt_skill_generator import PowerPointSkillGenerator
+    return PowerPointSkillGenerator
+
+def print_presentation_sizes(outputs):
+    """List each generated presentation with its size, skipping files that were not written."""
+    for output in outputs:
+        if not isinstance(output, str):
+            print(f"  📄 in-memory presentation ({len(output.getvalue()) / 1024:.1f} KB)")
+            continue
+        try:
+            size = os.stat(output).st_size / 1024  # Size in KB; one stat covers existence too
+        except FileNotFoundError:
+            continue
+        print(f"  📄 {output} ({size:.1f} KB)")
+
+def archive_presentations(paths, tar_path):
+    """Pack the generated presentations, flat, into one uncompressed tar and return its path."""
+    with tarfile.open(tar_path, 'w') as tar:
+        for path in paths:
+            tar.add(path, arcname=os.path.basename(path))
+    return tar_path
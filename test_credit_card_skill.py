@@ -4,9 +4,30 @@ Test the PowerPoint Skill Generator with credit card origination data
 """
 
 import pandas as pd
+import numpy as np
 import os
-from credit_card_data_generator import generate_credit_card_origination_data, create_credit_card_summary_stats
+import tempfile
+from io import BytesIO
+from functools import lru_cache
+from pathlib import Path
+from pptx import Presentation
+from pptx.util import Inches
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from credit_card_data_generator import (generate_credit_card_origination_data, create_credit_card_summary_stats,
+                                        write_xlsx_streaming, _format_application_ids)
 from ppt_skill_generator import PowerPointSkillGenerator
+from ppt_handler import PowerPointHandler
+from script_utils import print_presentation_sizes
+
+@lru_cache(maxsize=None)
+def _credit_card_data():
+    """The 1000-row synthetic dataset shared by every test (generation is seeded)."""
+    return generate_credit_card_origination_data(num_records=1000)
+
+@lru_cache(maxsize=None)
+def _generator():
+    """One skill generator shared by every test; each call loads its own data source."""
+    return PowerPointSkillGenerator()
 
 def test_credit_card_analysis():
     """Test the skill with credit card origination data."""
@@ -14,11 +35,11 @@ def test_credit_card_analysis():
     
     # Generate synthetic credit card data
     print("1. Generating synthetic credit card origination data...")
-    df = generate_credit_card_origination_data(num_records=1000)
+    df = _credit_card_data()
     
     # Save the data
-    data_file = "credit_card_originations.xlsx"
-    df.to_excel(data_file, index=False)
+    data_file = "credit_card_originations.parquet"
+    df.to_parquet(data_file, index=False)
     print(f"   Generated {len(df)} credit card applications")
     print(f"   Data saved to: {data_file}")
     
@@ -30,7 +51,7 @@ def test_credit_card_analysis():
     
     # Initialize the skill generator
     print("\n2. Initializing PowerPoint Skill Generator...")
-    generator = PowerPointSkillGenerator()
+    generator = _generator()
     
     # Load data and get insights
     print("3. Analyzing data structure...")
@@ -69,27 +90,23 @@ def test_specific_analyses():
     """Test specific analyses on credit card data."""
     print("\n=== Testing Specific Analyses ===\n")
     
-    # Generate data
-    df = generate_credit_card_origination_data(num_records=1000)
-    generator = PowerPointSkillGenerator()
+    # Shared data and generator
+    df = _credit_card_data()
+    generator = _generator()
     
     # Test 1: Approval analysis by product type
     print("1. Creating approval analysis by product type...")
-    approval_by_product = df.groupby('Product_Type').agg({
-        'Approved': ['count', 'sum', 'mean'],
-        'Approved_Limit': 'mean'
-    }).round(2)
-    
-    approval_by_product.columns = ['Total_Applications', 'Approved_Count', 'Approval_Rate', 'Avg_Approved_Limit']
-    approval_by_product = approval_by_product.reset_index()
-    
-    # Save and analyze
-    approval_file = "approval_by_product.xlsx"
-    approval_by_product.to_excel(approval_file, index=False)
+    approval_by_product = df.groupby('Product_Type', observed=True).agg(
+        Total_Applications=('Approved', 'count'),
+        Approved_Count=('Approved', 'sum'),
+        Approval_Rate=('Approved', 'mean'),
+        Avg_Approved_Limit=('Approved_Limit', 'mean')
+    ).reset_index()
     
+    # Analyze the aggregated frame directly; no file round trip needed
     output1 = generator.create_custom_chart(
         chart_type='bar',
-        data_source=approval_file,
+        data_source=approval_by_product,
         config={
             'x_column': 'Product_Type',
             'y_column': 'Approval_Rate'
@@ -101,12 +118,10 @@ def test_specific_analyses():
     # Test 2: Credit score distribution
     print("2. Creating credit score distribution analysis...")
     credit_score_data = df[['Credit_Score', 'Approved']].copy()
-    credit_score_file = "credit_score_distribution.xlsx"
-    credit_score_data.to_excel(credit_score_file, index=False)
     
     output2 = generator.create_custom_chart(
         chart_type='histogram',
-        data_source=credit_score_file,
+        data_source=credit_score_data,
         config={
             'column': 'Credit_Score',
             'bins': 20
@@ -117,19 +132,15 @@ def test_specific_analyses():
     
     # Test 3: Monthly trends
     print("3. Creating monthly application trends...")
-    monthly_data = df.groupby('Month').agg({
-        'Application_ID': 'count',
-        'Approved': 'sum'
-    }).reset_index()
-    monthly_data.columns = ['Month', 'Total_Applications', 'Approved_Applications']
+    monthly_data = df.groupby('Month').agg(
+        Total_Applications=('Application_ID', 'count'),
+        Approved_Applications=('Approved', 'sum')
+    ).reset_index()
     monthly_data['Approval_Rate'] = monthly_data['Approved_Applications'] / monthly_data['Total_Applications']
     
-    monthly_file = "monthly_trends.xlsx"
-    monthly_data.to_excel(monthly_file, index=False)
-    
     output3 = generator.create_custom_chart(
         chart_type='line',
-        data_source=monthly_file,
+        data_source=monthly_data,
         config={
             'x_column': 'Month',
             'y_column': 'Total_Applications'
@@ -144,34 +155,30 @@ def test_income_vs_credit_limit():
     """Test relationship between income and approved credit limits."""
     print("\n=== Testing Income vs Credit Limit Analysis ===\n")
     
-    # Generate data
-    df = generate_credit_card_origination_data(num_records=1000)
+    # Shared data
+    df = _credit_card_data()
     
     # Filter for approved applications only
     approved_df = df[df['Approved']].copy()
     
-    # Create income brackets
-    approved_df['Income_Bracket'] = pd.cut(approved_df['Annual_Income'], 
-                                          bins=[0, 40000, 75000, 125000, 200000, float('inf')],
-                                          labels=['<40k', '40k-75k', '75k-125k', '125k-200k', '>200k'])
+    # Create income brackets (right-closed, as pd.cut would) straight from the bin codes
+    bracket_codes = np.digitize(approved_df['Annual_Income'].to_numpy(), [40000, 75000, 125000, 200000], right=True)
+    approved_df['Income_Bracket'] = pd.Categorical.from_codes(
+        bracket_codes, categories=['<40k', '40k-75k', '75k-125k', '125k-200k', '>200k'], ordered=True)
     
     # Aggregate by income bracket
-    income_analysis = approved_df.groupby('Income_Bracket').agg({
-        'Approved_Limit': ['mean', 'median', 'count'],
-        'Credit_Score': 'mean'
-    }).round(2)
-    
-    income_analysis.columns = ['Avg_Limit', 'Median_Limit', 'Count', 'Avg_Credit_Score']
-    income_analysis = income_analysis.reset_index()
-    
-    # Save and analyze
-    income_file = "income_vs_limit.xlsx"
-    income_analysis.to_excel(income_file, index=False)
+    income_analysis = approved_df.groupby('Income_Bracket', observed=True).agg(
+        Avg_Limit=('Approved_Limit', 'mean'),
+        Median_Limit=('Approved_Limit', 'median'),
+        Count=('Approved_Limit', 'count'),
+        Avg_Credit_Score=('Credit_Score', 'mean')
+    ).reset_index()
     
-    generator = PowerPointSkillGenerator()
+    # Analyze the aggregated frame directly
+    generator = _generator()
     output = generator.create_custom_chart(
         chart_type='bar',
-        data_source=income_file,
+        data_source=income_analysis,
         config={
             'x_column': 'Income_Bracket',
             'y_column': 'Avg_Limit'
@@ -182,21 +189,195 @@ def test_income_vs_credit_limit():
     print(f"Created income vs credit limit analysis: {output}")
     return output
 
-def cleanup_test_files():
-    """Clean up test files."""
-    test_files = [
-        "credit_card_originations.xlsx",
-        "approval_by_product.xlsx",
-        "credit_score_distribution.xlsx",
-        "monthly_trends.xlsx",
-        "income_vs_limit.xlsx"
+def test_summary_stats_small_sample():
+    """Summary breakdowns list only values present in the data, not every category."""
+    sample = _credit_card_data().head(7)
+    summary = create_credit_card_summary_stats(sample)
+    for key, column in [('applications_by_state', 'State'),
+                        ('applications_by_channel', 'Application_Channel'),
+                        ('applications_by_product', 'Product_Type')]:
+        assert set(summary[key]) == set(sample[column].unique())
+        assert sum(summary[key].values()) == len(sample)
+
+def test_application_ids_across_workers():
+    """IDs stay unique and contiguous across chunk boundaries, and widen past num_digits."""
+    num_records = 1001
+    df = generate_credit_card_origination_data(num_records=num_records, num_workers=3)
+    assert df['Application_ID'].tolist() == [f'CC2023{i:06d}' for i in range(num_records)]
+    assert df['Application_ID'].is_unique
+    
+    # Each chunk draws from its own spawned stream, so chunks don't repeat one another
+    first, second = np.array_split(df['Credit_Score'].to_numpy(), 3)[:2]
+    assert not np.array_equal(first[:100], second[:100])
+    
+    # The array path ends exactly at 999999; longer runs fall back to per-row formatting
+    assert list(_format_application_ids(10 ** 6 - 3, 3)) == ['CC2023999997', 'CC2023999998', 'CC2023999999']
+    assert list(_format_application_ids(10 ** 6 - 2, 4)) == ['CC2023999998', 'CC2023999999',
+                                                             'CC20231000000', 'CC20231000001']
+
+def test_write_xlsx_streaming_round_trip():
+    """The streamed workbook reads back to the same values (categoricals, datetimes, bools, float32).
+    
+    Missing values (NaN, NaT, missing categories) are written as blank cells.
+    """
+    df = _credit_card_data().copy()
+    df.loc[3, ['Application_Date', 'Annual_Income', 'State', 'Requested_Limit']] = [pd.NaT, np.nan, np.nan, np.nan]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xlsx_path = os.path.join(tmp_dir, "originations.xlsx")
+        write_xlsx_streaming(df, xlsx_path)
+        round_trip = pd.read_excel(xlsx_path)
+    
+    assert list(round_trip.columns) == list(df.columns)
+    pd.testing.assert_frame_equal(round_trip.astype(df.dtypes.to_dict()), df)
+    assert round_trip.loc[3, ['Application_Date', 'Annual_Income', 'State', 'Requested_Limit']].isna().all()
+
+def test_load_csv_in_chunks():
+    """Chunked CSV parsing with a column projection loads every row of just those columns."""
+    df = _credit_card_data()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "originations.csv")
+        df.to_csv(csv_path, index=False)
+        
+        generator = PowerPointSkillGenerator()
+        generator.load_data(csv_path, columns=['Credit_Score', 'Approved'], chunksize=300)
+    
+    assert list(generator.data.columns) == ['Credit_Score', 'Approved']
+    assert generator.data.index.equals(pd.RangeIndex(len(df)))
+    assert generator.data['Credit_Score'].tolist() == df['Credit_Score'].tolist()
+    assert generator.analysis['shape'] == (len(df), 2)
+
+def test_load_data_downcast():
+    """downcast=True narrows integer columns losslessly and leaves other columns alone."""
+    df = _credit_card_data()
+    columns = ['Customer_Age', 'Credit_Score', 'Annual_Income']
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "originations.csv")
+        df.to_csv(csv_path, index=False)
+        
+        generator = PowerPointSkillGenerator()
+        generator.load_data(csv_path, columns=columns, chunksize=300, downcast=True)
+    
+    data = generator.data
+    assert list(data.columns) == columns
+    assert data['Customer_Age'].dtype == np.int8
+    assert data['Credit_Score'].dtype == np.int16
+    assert data['Annual_Income'].dtype == np.float64
+    assert data['Customer_Age'].tolist() == df['Customer_Age'].tolist()
+    assert data['Credit_Score'].tolist() == df['Credit_Score'].tolist()
+
+def test_reload_after_in_place_edit():
+    """Reloading a DataFrame edited in place re-analyzes it unless reuse_analysis is set."""
+    df = _credit_card_data()[['Credit_Score', 'Annual_Income']].copy()
+    generator = PowerPointSkillGenerator()
+    generator.load_data(df)
+    assert generator.analysis['missing_values']['Annual_Income'] == 0
+    
+    df.loc[:9, 'Annual_Income'] = np.nan
+    generator.load_data(df, reuse_analysis=True)
+    assert generator.analysis['missing_values']['Annual_Income'] == 0
+    generator.load_data(df)
+    assert generator.analysis['missing_values']['Annual_Income'] == 10
+
+def test_batch_with_template():
+    """Batch-process data files with a template; workers keep rendering charts in-process."""
+    print("\n=== Testing Batch Processing with a Template ===\n")
+    
+    df = _credit_card_data()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template_path = os.path.join(tmp_dir, "template.pptx")
+        Presentation().save(template_path)
+        
+        data_files = []
+        for product in ['Classic', 'Secured']:
+            data_file = os.path.join(tmp_dir, f"{product}.parquet")
+            df[df['Product_Type'] == product].to_parquet(data_file, index=False)
+            data_files.append(data_file)
+        
+        output_dir = os.path.join(tmp_dir, "output")
+        generated = _generator().batch_process(data_files, output_dir=output_dir,
+                                               template_path=template_path, max_workers=1)
+        assert [os.path.basename(path) for path in generated] == ['Classic_analysis.pptx',
+                                                                 'Secured_analysis.pptx']
+        assert all(os.path.getsize(path) > 0 for path in generated)
+        
+        # The template is loaded into the existing handler, so its max_workers survives
+        generator = PowerPointSkillGenerator()
+        handler = generator.ppt_handler
+        handler.max_workers = 1
+        generator.create_presentation(data_files[0], output_path=os.path.join(tmp_dir, "single.pptx"),
+                                      template_path=template_path)
+        assert generator.ppt_handler is handler
+        assert handler.max_workers == 1
+        assert handler.template_path == template_path
+    
+    print(f"Created {len(generated)} presentations from template")
+    return generated
+
+def test_batch_uses_generator_template():
+    """batch_process without a template uses the one the generator was built with."""
+    df = _credit_card_data()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # A widescreen template, so its decks are told apart from the default 4:3 ones
+        template = Presentation()
+        template.slide_width, template.slide_height = Inches(13.333), Inches(7.5)
+        template_path = os.path.join(tmp_dir, "widescreen.pptx")
+        template.save(template_path)
+        
+        data_file = os.path.join(tmp_dir, "Gold.parquet")
+        df[df['Product_Type'] == 'Gold'].to_parquet(data_file, index=False)
+        
+        generator = PowerPointSkillGenerator(template_path=template_path)
+        generated = generator.batch_process([data_file], output_dir=os.path.join(tmp_dir, "output"))
+        assert len(generated) == 1
+        deck = Presentation(generated[0])
+        assert (deck.slide_width, deck.slide_height) == (template.slide_width, template.slide_height)
+
+def test_render_pool():
+    """With max_workers=2 the chart images are rendered in a process pool, one picture per chart slide."""
+    df = _credit_card_data()
+    chart_configs = [
+        {'chart_type': 'histogram', 'column': 'Credit_Score', 'bins': 20},
+        {'chart_type': 'scatter', 'x_column': 'Annual_Income', 'y_column': 'Approved_Limit'},
+        {'chart_type': 'pie', 'labels_column': 'Product_Type', 'values_column': 'Requested_Limit'},
     ]
+    handler = PowerPointHandler(max_workers=2)
+    assert all(isinstance(image, bytes) for image in handler._render_chart_images(df, chart_configs))
+    buffer = handler.create_presentation_from_data(df, chart_configs, "Render Pool", output_path=BytesIO())
+    
+    buffer.seek(0)
+    slides = Presentation(buffer).slides
+    # Title and summary slides, then one slide per chart
+    assert len(slides) == len(chart_configs) + 2
+    for slide in list(slides)[2:]:
+        assert sum(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in slide.shapes) == 1
+
+def test_batch_process_dataframes():
+    """One presentation per in-memory frame, with both thread and process workers."""
+    df = _credit_card_data()
+    frames = {channel: df[df['Application_Channel'] == channel]
+              for channel in ['Online', 'Branch']}
+    
+    for use_processes in (False, True):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            generated = _generator().batch_process_dataframes(frames, output_dir=tmp_dir, max_workers=2,
+                                                              use_processes=use_processes)
+            assert generated == [os.path.join(tmp_dir, f"{name}_analysis.pptx") for name in frames]
+            for path in generated:
+                slides = Presentation(path).slides
+                # Title and summary slides, then at least one chart
+                assert len(slides) >= 3
+                assert slides[0].shapes.title.text.endswith(" Analysis")
+
+def cleanup_test_files():
+    """Clean up the data fixture files, whatever format they were written in."""
+    removed = []
+    for path in Path('.').glob('credit_card_originations.*'):
+        path.unlink(missing_ok=True)
+        removed.append(f"Removed: {path.name}")
     
     print("\n=== Cleaning Up Test Files ===")
-    for file in test_files:
-        if os.path.exists(file):
-            os.remove(file)
-            print(f"Removed: {file}")
+    if removed:
+        print("\n".join(removed))
 
 def main():
     """Run all tests."""
@@ -213,6 +394,9 @@ def main():
         # Income analysis
         income_output = test_income_vs_credit_limit()
         
+        # Batch processing with a template
+        batch_outputs = test_batch_with_template()
+        
         # Summary
         print("\n" + "=" * 60)
         print("TEST SUMMARY")
@@ -220,15 +404,12 @@ def main():
         print(f"✓ Main analysis presentation: {main_output}")
         print(f"✓ Specific analysis presentations: {len(specific_outputs)} created")
         print(f"✓ Income analysis presentation: {income_output}")
+        print(f"✓ Batch presentations with template: {len(batch_outputs)} created")
         print(f"✓ Total charts recommended: {len(recommendations)}")
         print(f"✓ Data quality score: {insights['recommendations']['data_quality']['completeness']:.1f}%")
         
         print("\nGenerated PowerPoint files:")
-        all_outputs = [main_output] + specific_outputs + [income_output]
-        for output in all_outputs:
-            if os.path.exists(output):
-                size = os.path.getsize(output) / 1024  # Size in KB
-                print(f"  📄 {output} ({size:.1f} KB)")
+        print_presentation_sizes([main_output] + specific_outputs + [income_output])
         
         # Ask about cleanup
         print("\n" + "=" * 60)
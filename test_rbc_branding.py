@@ -7,30 +7,36 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
-from ppt_skill_generator import PowerPointSkillGenerator
+import sys
+import tempfile
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
 from rbc_branding import RBCBranding
+from script_utils import (MONTHS_2023, archive_presentations, print_presentation_sizes,
+                          skill_generator_class)
 
 def create_rbc_sample_data():
     """Create sample data suitable for RBC-style presentations."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Monthly financial data (good for line charts)
-    months = pd.date_range(start='2023-01-01', end='2023-12-31', freq='ME')
+    months = MONTHS_2023
+    revenue = np.cumsum(rng.uniform(50, 150, len(months))) + 1000
+    expenses = np.cumsum(rng.uniform(30, 80, len(months))) + 600
     financial_data = pd.DataFrame({
         'Month': months,
-        'Revenue': np.cumsum(np.random.uniform(50, 150, len(months))) + 1000,
-        'Expenses': np.cumsum(np.random.uniform(30, 80, len(months))) + 600,
-        'Net_Income': None
+        'Revenue': revenue,
+        'Expenses': expenses,
+        'Net_Income': revenue - expenses
     })
-    financial_data['Net_Income'] = financial_data['Revenue'] - financial_data['Expenses']
     
     # Product performance data (good for bar charts)
     products = ['Wealth Management', 'Personal Banking', 'Commercial Banking', 'Capital Markets', 'Insurance']
     product_data = pd.DataFrame({
         'Product': products,
-        'Q1_Revenue': np.random.uniform(200, 800, len(products)),
-        'Q2_Revenue': np.random.uniform(250, 900, len(products)),
-        'Growth_Rate': np.random.uniform(-5, 15, len(products))
+        'Q1_Revenue': rng.uniform(200, 800, len(products)),
+        'Q2_Revenue': rng.uniform(250, 900, len(products)),
+        'Growth_Rate': rng.uniform(-5, 15, len(products))
     })
     
     # Regional distribution (good for pie charts)
@@ -43,9 +49,9 @@ def create_rbc_sample_data():
     
     # Risk metrics (good for scatter plots)
     risk_data = pd.DataFrame({
-        'Credit_Score': np.random.normal(650, 100, 100),
-        'Loan_Amount': np.random.uniform(10000, 500000, 100),
-        'Risk_Level': np.random.choice(['Low', 'Medium', 'High'], 100)
+        'Credit_Score': rng.normal(650, 100, 100),
+        'Loan_Amount': rng.uniform(10000, 500000, 100),
+        'Risk_Level': pd.Categorical.from_codes(rng.choice(3, 100), ['Low', 'Medium', 'High'])
     })
     
     return {
@@ -55,16 +61,18 @@ def create_rbc_sample_data():
         'risk': risk_data
     }
 
-def test_rbc_branding():
-    """Test the skill with RBC branding."""
+def _render(job):
+    """Run one (step, method, kwargs) job on a fresh generator; module level so workers can pickle it."""
+    _, method, kwargs = job
+    return getattr(skill_generator_class()(), method)(**kwargs)
+
+def test_rbc_branding(output_dir='', in_memory=False):
+    """Test the skill with RBC branding; `in_memory` saves the presentations to BytesIO buffers."""
     print("=== Testing PowerPoint Skill Generator with RBC Branding ===\n")
     
     # Create sample data
     datasets = create_rbc_sample_data()
     
-    # Initialize the skill generator
-    generator = PowerPointSkillGenerator()
-    
     print("1. RBC Color Palette:")
     for color_name, hex_code in RBCBranding.COLORS.items():
         print(f"   {color_name}: {hex_code}")
@@ -73,94 +81,120 @@ def test_rbc_branding():
     for font_name, font in RBCBranding.FONTS.items():
         print(f"   {font_name}: {font}")
     
-    # Test 1: Financial performance line chart
-    print("\n3. Creating Financial Performance Chart...")
-    output1 = generator.create_custom_chart(
-        chart_type='line',
-        data_source=datasets['financial'],
-        config={
-            'x_column': 'Month',
-            'y_column': 'Revenue'
+    # The four custom charts share one deck, so the presentation is zipped and written once
+    charts = [
+        {
+            'chart_type': 'line',
+            'data_source': datasets['financial'],
+            'config': {
+                'x_column': 'Month',
+                'y_column': 'Revenue'
+            },
+            'title': "Financial Performance"
         },
-        output_path="rbc_financial_performance.pptx"
-    )
-    print(f"   Generated: {output1}")
-    
-    # Test 2: Product performance bar chart
-    print("\n4. Creating Product Performance Chart...")
-    output2 = generator.create_custom_chart(
-        chart_type='bar',
-        data_source=datasets['products'],
-        config={
-            'x_column': 'Product',
-            'y_column': 'Growth_Rate'
+        {
+            'chart_type': 'bar',
+            'data_source': datasets['products'],
+            'config': {
+                'x_column': 'Product',
+                'y_column': 'Growth_Rate'
+            },
+            'title': "Product Performance"
         },
-        output_path="rbc_product_performance.pptx"
-    )
-    print(f"   Generated: {output2}")
-    
-    # Test 3: Regional distribution pie chart
-    print("\n5. Creating Regional Distribution Chart...")
-    output3 = generator.create_custom_chart(
-        chart_type='pie',
-        data_source=datasets['regional'],
-        config={
-            'labels_column': 'Region',
-            'values_column': 'Market_Share'
+        {
+            'chart_type': 'pie',
+            'data_source': datasets['regional'],
+            'config': {
+                'labels_column': 'Region',
+                'values_column': 'Market_Share'
+            },
+            'title': "Regional Distribution"
         },
-        output_path="rbc_regional_distribution.pptx"
-    )
-    print(f"   Generated: {output3}")
-    
-    # Test 4: Risk analysis scatter plot
-    print("\n6. Creating Risk Analysis Chart...")
-    output4 = generator.create_custom_chart(
-        chart_type='scatter',
-        data_source=datasets['risk'],
-        config={
-            'x_column': 'Credit_Score',
-            'y_column': 'Loan_Amount'
+        {
+            'chart_type': 'scatter',
+            'data_source': datasets['risk'],
+            'config': {
+                'x_column': 'Credit_Score',
+                'y_column': 'Loan_Amount'
+            },
+            'title': "Risk Analysis"
         },
-        output_path="rbc_risk_analysis.pptx"
-    )
-    print(f"   Generated: {output4}")
-    
-    # Test 5: Complete presentation with multiple charts
-    print("\n7. Creating Complete RBC-Styled Presentation...")
-    generator = PowerPointSkillGenerator()  # Fresh instance
-    output5 = generator.create_presentation(
-        data_source=datasets['financial'],
-        title="RBC Financial Performance Analysis",
-        output_path="rbc_complete_analysis.pptx"
-    )
-    print(f"   Generated: {output5}")
-    
-    return [output1, output2, output3, output4, output5]
+    ]
+    jobs = [
+        ("3. Creating RBC Chart Deck (financial, product, regional, risk)...", 'create_chart_deck', {
+            'charts': charts,
+            'title': "RBC Chart Deck",
+            'output_path': BytesIO() if in_memory else os.path.join(output_dir, "rbc_chart_deck.pptx")
+        }),
+        ("4. Creating Complete RBC-Styled Presentation...", 'create_presentation', {
+            'data_source': datasets['financial'],
+            'title': "RBC Financial Performance Analysis",
+            'output_path': BytesIO() if in_memory else os.path.join(output_dir, "rbc_complete_analysis.pptx")
+        }),
+    ]
+    
+    # The presentations share no state, so render them in parallel and report in order
+    num_workers = min(len(jobs), os.cpu_count() or 1)
+    if num_workers <= 1:
+        outputs = list(map(_render, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            outputs = list(executor.map(_render, jobs))
+    
+    for (step, _, _), output in zip(jobs, outputs):
+        print(f"\n{step}")
+        print(f"   Generated: {output if isinstance(output, str) else 'in-memory presentation'}")
+    
+    return outputs
+
+def test_in_memory_chart_deck():
+    """A deck built with new_presentation/append_chart/save into BytesIO is a complete .pptx."""
+    from pptx import Presentation
+    
+    datasets = create_rbc_sample_data()
+    charts = [
+        ('line', datasets['financial'], {'x_column': 'Month', 'y_column': 'Revenue'}),
+        ('bar', datasets['products'], {'x_column': 'Product', 'y_column': 'Growth_Rate'}),
+        ('pie', datasets['regional'], {'labels_column': 'Region', 'values_column': 'Market_Share'}),
+    ]
+    
+    generator = skill_generator_class()()
+    generator.new_presentation("RBC In-Memory Deck")
+    slide_indexes = [generator.append_chart(*chart) for chart in charts]
+    buffer = generator.save(BytesIO())
+    
+    # A .pptx is a zip archive; title slide plus one slide per chart
+    assert buffer.getvalue()[:2] == b'PK'
+    assert slide_indexes == list(range(1, len(charts) + 1))
+    buffer.seek(0)
+    assert len(Presentation(buffer).slides) == len(charts) + 1
 
 def display_rbc_branding_info():
     """Display RBC branding information."""
-    print("\n" + "="*60)
-    print("RBC BRAND GUIDELINES")
-    print("="*60)
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("RBC BRAND GUIDELINES")
+    lines.append("="*60)
     
-    print("\n🎨 PRIMARY COLORS:")
-    print(f"   Primary Blue: {RBCBranding.COLORS['primary_blue']}")
-    print(f"   Accent Yellow: {RBCBranding.COLORS['accent_yellow']}")
-    print(f"   White: {RBCBranding.COLORS['white']}")
+    lines.append("\n🎨 PRIMARY COLORS:")
+    lines.append(f"   Primary Blue: {RBCBranding.COLORS['primary_blue']}")
+    lines.append(f"   Accent Yellow: {RBCBranding.COLORS['accent_yellow']}")
+    lines.append(f"   White: {RBCBranding.COLORS['white']}")
     
-    print("\n📊 CHART COLOR PALETTES:")
+    lines.append("\n📊 CHART COLOR PALETTES:")
     for palette_name, colors in RBCBranding.CHART_PALETTES.items():
-        print(f"   {palette_name.title()}: {colors}")
+        lines.append(f"   {palette_name.title()}: {colors}")
     
-    print("\n🔤 TYPOGRAPHY:")
-    print(f"   Primary Font: {RBCBranding.FONTS['primary']}")
-    print(f"   Heading Font: {RBCBranding.FONTS['heading']}")
-    print(f"   Body Font: {RBCBranding.FONTS['body']}")
-    print(f"   Data Labels: {RBCBranding.FONTS['data_labels']}")
+    lines.append("\n🔤 TYPOGRAPHY:")
+    lines.append(f"   Primary Font: {RBCBranding.FONTS['primary']}")
+    lines.append(f"   Heading Font: {RBCBranding.FONTS['heading']}")
+    lines.append(f"   Body Font: {RBCBranding.FONTS['body']}")
+    lines.append(f"   Data Labels: {RBCBranding.FONTS['data_labels']}")
     
-    print("\n📏 FONT SIZES:")
+    lines.append("\n📏 FONT SIZES:")
     for size_name, size in RBCBranding.FONT_SIZES.items():
-        print(f"   {size_name.replace('_', ' ').title()}: {size}pt")
+        lines.append(f"   {size_name.replace('_', ' ').title()}: {size}pt")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     print("PowerPoint Skill Generator - RBC Branding Test")
@@ -168,19 +202,26 @@ if __name__ == "__main__":
     
     # Display RBC branding info
     display_rbc_branding_info()
-    
-    # Test RBC branding
-    generated_files = test_rbc_branding()
+    if '--info-only' in sys.argv:
+        sys.exit(0)
+    
+    # Test RBC branding; --tar renders into a scratch directory and keeps a single archive
+    # RBC_NODISK=1 (CI smoke runs) keeps the presentations in memory instead
+    if os.getenv('RBC_NODISK'):
+        presentations = generated_files = test_rbc_branding(in_memory=True)
+    elif '--tar' in sys.argv:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            presentations = test_rbc_branding(tmpdir)
+            generated_files = [archive_presentations(presentations, "rbc_artifacts.tar")]
+    else:
+        presentations = generated_files = test_rbc_branding()
     
     print("\n" + "=" * 60)
     print("RBC BRANDING TEST SUMMARY")
     print("=" * 60)
     
-    print(f"✓ Generated {len(generated_files)} RBC-styled presentations:")
-    for file in generated_files:
-        if os.path.exists(file):
-            size = os.path.getsize(file) / 1024  # Size in KB
-            print(f"  📄 {file} ({size:.1f} KB)")
+    print(f"✓ Generated {len(presentations)} RBC-styled presentations:")
+    print_presentation_sizes(generated_files)
     
     print("\n🎯 All charts now use RBC's official color scheme and typography!")
     print("📋 Presentations feature:")
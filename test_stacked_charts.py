@@ -7,53 +7,51 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
-from ppt_skill_generator import PowerPointSkillGenerator
+import sys
+import tempfile
+from script_utils import (MONTHS_2023, archive_presentations, print_presentation_sizes,
+                          skill_generator_class)
+
+# Product lines in the sample data, in the order they are stacked
+PRODUCTS = ['Wealth Management', 'Personal Banking', 'Commercial Banking', 'Capital Markets']
 
 def create_stacked_chart_data():
     """Create sample data suitable for stacked charts."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Monthly financial data for stacked area chart (100%)
-    months = pd.date_range(start='2023-01-01', end='2023-12-31', freq='ME')
+    months = MONTHS_2023
+    revenue = np.cumsum(rng.uniform(50, 150, len(months))) + 1000
+    expenses = np.cumsum(rng.uniform(30, 80, len(months))) + 600
+    operating_income = revenue - expenses
     financial_data = pd.DataFrame({
         'Month': months,
-        'Revenue': np.cumsum(np.random.uniform(50, 150, len(months))) + 1000,
-        'Expenses': np.cumsum(np.random.uniform(30, 80, len(months))) + 600,
-        'Operating_Income': None,
-        'Net_Income': None
+        'Revenue': revenue,
+        'Expenses': expenses,
+        'Operating_Income': operating_income,
+        'Net_Income': operating_income - operating_income * 0.1
     })
-    financial_data['Operating_Income'] = financial_data['Revenue'] - financial_data['Expenses']
-    financial_data['Net_Income'] = financial_data['Operating_Income'] - financial_data['Operating_Income'] * 0.1
     
     # Product performance data for stacked bar chart
-    products = ['Wealth Management', 'Personal Banking', 'Commercial Banking', 'Capital Markets']
+    products = PRODUCTS
     quarters = ['Q1', 'Q2', 'Q3', 'Q4']
     
-    product_data = []
-    for product in products:
-        for quarter in quarters:
-            product_data.append({
-                'Product': product,
-                'Quarter': quarter,
-                'Revenue': np.random.uniform(100, 500),
-                'Profit': np.random.uniform(20, 100)
-            })
-    
-    product_df = pd.DataFrame(product_data)
+    # One row per product and quarter, product-major; the repeated labels are stored as categories
+    n_rows = len(products) * len(quarters)
+    product_df = pd.DataFrame({
+        'Product': pd.Categorical.from_codes(np.repeat(np.arange(len(products)), len(quarters)), products),
+        'Quarter': pd.Categorical.from_codes(np.tile(np.arange(len(quarters)), len(products)), quarters),
+        'Revenue': rng.uniform(100, 500, n_rows),
+        'Profit': rng.uniform(20, 100, n_rows)
+    })
     
     # Profile distribution data (good for 100% area chart)
     age_groups = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
-    profile_data = []
-    for age_group in age_groups:
-        profile_data.append({
-            'Age_Group': age_group,
-            'Conservative': np.random.uniform(10, 30),
-            'Moderate': np.random.uniform(20, 40),
-            'Aggressive': np.random.uniform(15, 35),
-            'Very_Aggressive': np.random.uniform(5, 20)
-        })
-    
-    profile_df = pd.DataFrame(profile_data)
+    profiles = ['Conservative', 'Moderate', 'Aggressive', 'Very_Aggressive']
+    # Each column is drawn from its own range: low/high broadcast across the profile columns
+    shares = rng.uniform([10, 20, 15, 5], [30, 40, 35, 20], (len(age_groups), len(profiles)))
+    profile_df = pd.DataFrame(shares, columns=profiles)
+    profile_df.insert(0, 'Age_Group', age_groups)
     
     return {
         'financial': financial_data,
@@ -61,7 +59,14 @@ def create_stacked_chart_data():
         'profiles': profile_df
     }
 
-def test_stacked_charts():
+def _row_normalize_pct(values):
+    """Each row of `values` as percentages of the row total; all-zero rows stay zero."""
+    totals = values.sum(axis=1, keepdims=True)
+    # One scale per row, so the full array is multiplied once rather than divided then scaled
+    scale = np.divide(100.0, totals, out=np.zeros_like(totals, dtype=float), where=totals != 0)
+    return values * scale
+
+def test_stacked_charts(output_dir=''):
     """Test the new stacked chart functionality."""
     print("=== Testing Stacked Charts with RBC Branding ===\n")
     
@@ -69,49 +74,40 @@ def test_stacked_charts():
     datasets = create_stacked_chart_data()
     
     # Initialize the skill generator
-    generator = PowerPointSkillGenerator()
+    generator = skill_generator_class()()
     
     # Test 1: Stacked Bar Chart (100%)
     print("1. Creating Stacked Bar Chart (100%)...")
     
-    # Pivot product data for stacked bar chart
-    pivot_data = datasets['products'].pivot_table(
-        index='Quarter',
-        columns='Product',
-        values='Revenue',
-        aggfunc='sum',
-        fill_value=0
-    ).reset_index()
-    
-    # Calculate percentages
-    numeric_cols = pivot_data.columns[1:]  # Skip Quarter column
-    pivot_data[numeric_cols] = pivot_data[numeric_cols].div(pivot_data[numeric_cols].sum(axis=1), axis=0) * 100
+    # Revenue per quarter and product, as each product's percentage of the quarter's total
+    revenue = (datasets['products'].groupby(['Quarter', 'Product'], observed=True)['Revenue'].sum()
+               .unstack(fill_value=0).reindex(columns=PRODUCTS, fill_value=0))
+    shares = _row_normalize_pct(revenue.to_numpy())
+    pivot_data = pd.DataFrame(shares, index=revenue.index, columns=revenue.columns).reset_index()
     
     output1 = generator.create_custom_chart(
         chart_type='stacked_bar',
         data_source=pivot_data,
         config={
             'x_column': 'Quarter',
-            'y_columns': numeric_cols.tolist()
+            'y_columns': PRODUCTS
         },
-        output_path="rbc_stacked_bar_chart.pptx"
+        output_path=os.path.join(output_dir, "rbc_stacked_bar_chart.pptx")
     )
     print(f"   Generated: {output1}")
     
     # Test 2: 100% Stacked Area Chart
     print("\n2. Creating 100% Stacked Area Chart...")
     
-    # Prepare financial data for stacked area chart
-    financial_data = datasets['financial'][['Month', 'Revenue', 'Expenses', 'Operating_Income', 'Net_Income']]
-    
+    # The financial frame holds exactly the charted columns, so it is passed as is
     output2 = generator.create_custom_chart(
         chart_type='stacked_area',
-        data_source=financial_data,
+        data_source=datasets['financial'],
         config={
             'x_column': 'Month',
             'y_columns': ['Revenue', 'Expenses', 'Operating_Income', 'Net_Income']
         },
-        output_path="rbc_stacked_area_chart.pptx"
+        output_path=os.path.join(output_dir, "rbc_stacked_area_chart.pptx")
     )
     print(f"   Generated: {output2}")
     
@@ -125,7 +121,7 @@ def test_stacked_charts():
             'x_column': 'Age_Group',
             'y_columns': ['Conservative', 'Moderate', 'Aggressive', 'Very_Aggressive']
         },
-        output_path="rbc_profile_distribution.pptx"
+        output_path=os.path.join(output_dir, "rbc_profile_distribution.pptx")
     )
     print(f"   Generated: {output3}")
     
@@ -133,27 +129,29 @@ def test_stacked_charts():
 
 def display_chart_info():
     """Display information about the new chart types."""
-    print("\n" + "="*60)
-    print("NEW STACKED CHART TYPES")
-    print("="*60)
-    
-    print("\n📊 STACKED BAR CHART:")
-    print("   • Vertical bars showing composition of multiple data series")
-    print("   • Each bar shows 100% of the total")
-    print("   • Good for comparing categories with sub-components")
-    print("   • Uses RBC categorical color palette")
-    
-    print("\n📈 100% STACKED AREA CHART:")
-    print("   • Area chart showing composition over time")
-    print("   • Y-axis shows percentage (0-100%)")
-    print("   • Good for profile distribution analysis")
-    print("   • Uses RBC sequential color palette")
-    
-    print("\n🎯 USE CASES:")
-    print("   • Financial performance breakdown")
-    print("   • Customer profile distributions")
-    print("   • Market share evolution")
-    print("   • Risk profile analysis")
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("NEW STACKED CHART TYPES")
+    lines.append("="*60)
+    
+    lines.append("\n📊 STACKED BAR CHART:")
+    lines.append("   • Vertical bars showing composition of multiple data series")
+    lines.append("   • Each bar shows 100% of the total")
+    lines.append("   • Good for comparing categories with sub-components")
+    lines.append("   • Uses RBC categorical color palette")
+    
+    lines.append("\n📈 100% STACKED AREA CHART:")
+    lines.append("   • Area chart showing composition over time")
+    lines.append("   • Y-axis shows percentage (0-100%)")
+    lines.append("   • Good for profile distribution analysis")
+    lines.append("   • Uses RBC sequential color palette")
+    
+    lines.append("\n🎯 USE CASES:")
+    lines.append("   • Financial performance breakdown")
+    lines.append("   • Customer profile distributions")
+    lines.append("   • Market share evolution")
+    lines.append("   • Risk profile analysis")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     print("PowerPoint Skill Generator - Stacked Charts Test")
@@ -161,19 +159,23 @@ if __name__ == "__main__":
     
     # Display chart information
     display_chart_info()
+    if '--info-only' in sys.argv:
+        sys.exit(0)
     
-    # Test stacked charts
-    generated_files = test_stacked_charts()
+    # Test stacked charts; --tar renders into a scratch directory and keeps a single archive
+    if '--tar' in sys.argv:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            presentations = test_stacked_charts(tmpdir)
+            generated_files = [archive_presentations(presentations, "rbc_stacked_artifacts.tar")]
+    else:
+        presentations = generated_files = test_stacked_charts()
     
     print("\n" + "=" * 60)
     print("STACKED CHARTS TEST SUMMARY")
     print("=" * 60)
     
-    print(f"✓ Generated {len(generated_files)} stacked chart presentations:")
-    for file in generated_files:
-        if os.path.exists(file):
-            size = os.path.getsize(file) / 1024  # Size in KB
-            print(f"  📄 {file} ({size:.1f} KB)")
+    print(f"✓ Generated {len(presentations)} stacked chart presentations:")
+    print_presentation_sizes(generated_files)
     
     print("\n🎯 All stacked charts use RBC branding and show 100% composition!")
     print("📋 Perfect for understanding profile distributions and component breakdowns.")